@@ -0,0 +1,50 @@
+"""Пакетная генерация арифметических заданий 1, 3 и 4 с помощью NumPy.
+
+generate_batch(task, n, seed) возвращает столбцы — словарь
+{имя параметра: массив, ..., "correct_answer": массив} — в тех же диапазонах,
+что и скалярные генераторы из problems. NumPy нужен только этому модулю.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy необязателен для приложения
+    np = None
+
+
+def _batch_task1(rng, n):
+    # A × (B – C), B < C
+    a = rng.integers(2, 10, size=n, endpoint=True)
+    b = rng.integers(20, 90, size=n, endpoint=True)
+    c = rng.integers(b + 1, 99, endpoint=True)
+    return {"a": a, "b": b, "c": c, "correct_answer": a * (b - c)}
+
+
+def _batch_task3(rng, n):
+    # a – b × (c)
+    a = np.round(rng.uniform(1.20, 1.99, size=n), 2)
+    b = np.round(rng.uniform(0.1, 0.9, size=n), 1)
+    c = np.round(rng.uniform(-2.9, -1.2, size=n), 1)
+    return {"a": a, "b": b, "c": c, "correct_answer": a - b * c}
+
+
+def _batch_task4(rng, n):
+    # A × |y + B| при y = C
+    a = rng.integers(-9, -2, size=n, endpoint=True)
+    b = rng.integers(2, 9, size=n, endpoint=True)
+    c = rng.integers(-19, -10, size=n, endpoint=True)
+    return {"a": a, "b": b, "c": c, "correct_answer": a * np.abs(c + b)}
+
+
+BATCH_GENERATORS = {
+    1: _batch_task1,
+    3: _batch_task3,
+    4: _batch_task4,
+}
+
+
+def generate_batch(task, n, seed=None):
+    """n условий задания task (1, 3 или 4) в виде столбцов NumPy."""
+    if np is None:
+        raise ImportError("Для пакетной генерации нужен пакет numpy")
+    if task not in BATCH_GENERATORS:
+        raise ValueError(f"Пакетная генерация не поддерживается для задания {task}")
+    return BATCH_GENERATORS[task](np.random.default_rng(seed), n)
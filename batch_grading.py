@@ -0,0 +1,247 @@
+"""Векторная проверка ответов к заданиям с целым ответом (1, 4, 8, 9, 10) с помощью NumPy.
+
+grade_arrays(keys, answers) принимает массив ключей условий (см. problems.make_key)
+и массив строк, как их ввели ученики, и возвращает маски правильных и неразборчивых
+ответов и долю правильных по заданиям. Результат совпадает с grading.grade.
+
+Правильные ответы считаются прямо из ключей: генератор splitmix64 из
+problems.KeyRandom и выборки randint/choice повторены над массивами, поэтому
+объекты условий не создаются. Ввод разбирается над матрицей кодов символов
+блоками по CHUNK_SIZE строк. Строки с символами вне ASCII (юникодные цифры
+и пробелы) и с числами длиннее MAX_DIGITS цифр разбираются по одной через
+grading — на реальных ответах таких почти нет. NumPy нужен только этому модулю.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy необязателен для приложения
+    np = None
+
+import grading
+import problems
+
+CHUNK_SIZE = 65536
+MAX_DIGITS = 18  # Столько цифр точно помещается в int64
+
+_GAMMA = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+# Классы символов ввода
+_PAD, _SPACE, _SIGN, _DIGIT, _POINT, _OTHER = range(6)
+# Порядок частей записи "  -12,50  ": пробелы, знак, целая часть, запятая, дробная часть,
+# пробелы, пустое место после строки; посторонний символ — вне порядка
+_LEAD, _SIGN_PART, _WHOLE, _POINT_PART, _FRACTION, _TRAIL, _END, _OTHER_PART = range(8)
+
+
+def _char_classes():
+    table = np.full(128, _OTHER, dtype=np.int8)
+    table[0] = _PAD
+    # Пробельные символы ASCII, которые \s распознаёт в строках str
+    table[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = _SPACE
+    table[[ord("+"), ord("-")]] = _SIGN
+    table[ord("0"):ord("9") + 1] = _DIGIT
+    table[[ord("."), ord(",")]] = _POINT
+    return table
+
+
+class _KeyStreams:
+    """Последовательности KeyRandom для массива ключей: по одному генератору на строку."""
+
+    def __init__(self, keys):
+        self.state = keys.astype(np.uint64)
+
+    def _next(self, rows=None):
+        # rows=None — следующее число для всех строк сразу, без выборки по индексам
+        if rows is None:
+            self.state += np.uint64(_GAMMA)
+            state = self.state
+        else:
+            state = self.state[rows] + np.uint64(_GAMMA)
+            self.state[rows] = state
+        z = (state ^ (state >> np.uint64(30))) * np.uint64(_MIX1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+        return z ^ (z >> np.uint64(31))
+
+    def below(self, n):
+        """Как KeyRandom._randbelow(n) для каждой строки; n — число или массив."""
+        n = np.asarray(n, dtype=np.int64)
+        # n.bit_length(): для n < 2**53 это показатель степени из frexp
+        shift = (64 - np.frexp(n.astype(np.float64))[1]).astype(np.uint64)
+        result = (self._next() >> shift).astype(np.int64)
+        # Отброшенные значения перевыбираются только в тех строках, где они выпали
+        pending = np.flatnonzero(result >= n)
+        while len(pending):
+            limit, bits = (n[pending], shift[pending]) if n.ndim else (n, shift)
+            r = (self._next(pending) >> bits).astype(np.int64)
+            ok = r < limit
+            result[pending[ok]] = r[ok]
+            pending = pending[~ok]
+        return result
+
+    def randint(self, a, b):
+        return a + self.below(np.asarray(b) - a + 1)
+
+
+def _answers_task1(rng):
+    a = rng.randint(2, 10)
+    b = rng.randint(20, 90)
+    c = rng.randint(b + 1, 99)
+    return a * (b - c)
+
+
+def _answers_task4(rng):
+    a = rng.randint(-9, -2)
+    b = rng.randint(2, 9)
+    c = rng.randint(-19, -10)
+    return a * np.abs(c + b)
+
+
+def _answers_task8(rng):
+    # Ответ — число этажей y; число квартир a на него не влияет и не выбирается
+    b = rng.randint(2, 6)
+    first = -(-6 // b) * b
+    y = first + b * rng.below((25 - first) // b + 1)
+    return y
+
+
+def _answers_task9(rng):
+    totals = np.array([total for _, _, _, total in problems.task9_index()], dtype=np.int64)
+    return totals[rng.below(len(totals))]
+
+
+def _answers_task10(rng):
+    a = rng.randint(2, 6)
+    denominator = (a - 1) * 10
+    b = denominator * (1 + rng.below(90 // denominator))
+    return b // denominator * 10
+
+
+# Задание -> (версия генератора, которую повторяет функция, функция)
+BATCH_ANSWERS = {
+    1: (1, _answers_task1),
+    4: (1, _answers_task4),
+    8: (1, _answers_task8),
+    9: (1, _answers_task9),
+    10: (2, _answers_task10),
+}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Для векторной проверки нужен пакет numpy")
+
+
+def answer_array(keys):
+    """Правильные ответы (int64) для массива ключей заданий из BATCH_ANSWERS."""
+    _require_numpy()
+    keys = np.asarray(keys, dtype=np.uint64)
+    tasks = (keys >> np.uint64(problems.SEED_BITS + problems.VERSION_BITS)).astype(np.int64)
+    versions = ((keys >> np.uint64(problems.SEED_BITS)) & np.uint64(0xF)).astype(np.int64)
+    answers = np.zeros(len(keys), dtype=np.int64)
+    supported = np.zeros(len(keys), dtype=bool)
+    for task_id, (version, func) in BATCH_ANSWERS.items():
+        if version != problems.GENERATOR_VERSIONS[task_id]:
+            raise RuntimeError(f"задание {task_id}: векторный генератор отстал от версии {problems.GENERATOR_VERSIONS[task_id]}")
+        rows = np.flatnonzero((tasks == task_id) & (versions == version))
+        if len(rows):
+            answers[rows] = func(_KeyStreams(keys[rows]))
+            supported[rows] = True
+    if not supported.all():
+        bad = int(keys[np.argmin(supported)])
+        raise ValueError(f"ключ {problems.key_text(bad)}: задание или версия не поддерживаются векторной проверкой")
+    return answers
+
+
+def _columns(answers):
+    """Коды символов ответов по столбцам: строка матрицы — позиция символа, столбец — ответ."""
+    answers = np.ascontiguousarray(answers)
+    width = max(answers.dtype.itemsize // 4, 1)
+    return np.ascontiguousarray(answers.view(np.uint32).reshape(len(answers), width).T)
+
+
+def _parse_chunk(answers, integer_only):
+    """Разбирает ответы; возвращает (значение, знаменатель 10**k, разобрано, нужен разбор по одному).
+
+    integer_only — маска строк, где принимается только целое число. Матрица
+    хранится по позициям символов, поэтому свёртки по строке идут вдоль оси 0
+    и обрабатывают сразу все ответы.
+    """
+    codes = _columns(answers)
+    classes = _CLASSES[np.minimum(codes, 127)]
+    digit = classes == _DIGIT
+    point = classes == _POINT
+    space = classes == _SPACE
+    seen_text = np.logical_or.accumulate(~space & (classes != _PAD), axis=0)
+    seen_point = np.logical_or.accumulate(point, axis=0)
+    # Пробел после текста — хвостовой, цифра после запятой — дробная часть
+    part = _PARTS[classes]
+    part[space & seen_text] = _TRAIL
+    part[digit & seen_point] = _FRACTION
+
+    # Части записи идут по порядку, знак и запятая не повторяются, посторонних символов нет
+    step = part[1:] - part[:-1]
+    broken = ((step < 0) | ((step == 0) & _SINGLE[part[1:]])).any(axis=0) | (part[-1] == _OTHER_PART)
+    digits = np.add.reduce(digit, axis=0, dtype=np.int64)
+    has_point = seen_point[-1]
+    valid = ~broken & (digits > 0) & ~(integer_only & has_point)
+    if len(codes) > grading.MAX_INPUT_LENGTH:
+        valid &= np.char.str_len(answers) <= grading.MAX_INPUT_LENGTH
+
+    # Значение всех цифр подряд: вес цифры — 10 в степени числа цифр после неё
+    after = np.cumsum(digit[::-1], axis=0, dtype=np.int64)[::-1]
+    weights = _POW10[np.minimum(after - 1, MAX_DIGITS)]
+    values = np.where(digit, (codes.astype(np.int64) - ord("0")) * weights, 0).sum(axis=0)
+    values = np.where((codes == ord("-")).any(axis=0), -values, values)
+    scales = _POW10[np.minimum(np.add.reduce(digit & seen_point, axis=0, dtype=np.int64), MAX_DIGITS)]
+    slow = (codes.max(axis=0) >= 128) | (digits > MAX_DIGITS)
+    return values, scales, valid & ~slow, slow
+
+
+def grade_arrays(keys, answers):
+    """Проверяет ответы answers к условиям с ключами keys.
+
+    Возвращает (correct, invalid, accuracy): маски правильных и неразборчивых
+    ответов и долю правильных {номер задания: доля} по заданиям, что есть в keys.
+    """
+    _require_numpy()
+    keys = np.asarray(keys, dtype=np.uint64)
+    expected = answer_array(keys)
+    tasks = (keys >> np.uint64(problems.SEED_BITS + problems.VERSION_BITS)).astype(np.int64)
+    # Задания 1 и 4 принимают и десятичную запись ("-70,0"), остальные — только целое
+    answers = np.asarray(answers, dtype=str)
+    correct = np.zeros(len(keys), dtype=bool)
+    invalid = np.zeros(len(keys), dtype=bool)
+    for start in range(0, len(keys), CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, len(keys))
+        values, scales, parsed, slow = _parse_chunk(answers[start:end], _INTEGER_FORM[tasks[start:end]])
+        # value / 10**k == p  <=>  |value| делится на 10**k и частное со знаком равно p
+        quotient = np.abs(values) // scales
+        exact = (np.abs(values) % scales == 0) & (np.where(values < 0, -quotient, quotient) == expected[start:end])
+        correct[start:end] = parsed & exact
+        invalid[start:end] = ~parsed & ~slow
+        for row in np.flatnonzero(slow):
+            index = start + row
+            task_id = int(tasks[index])
+            key = (int(expected[index]), 1, grading.FORM_SHAPES[problems.PROBLEM_TYPES[task_id].answer_form])
+            verdict = grading.grade_key(key, str(answers[index]))
+            correct[index] = verdict == grading.CORRECT
+            invalid[index] = verdict == grading.INVALID
+
+    counts = np.bincount(tasks, minlength=11)
+    hits = np.bincount(tasks, weights=correct, minlength=11)
+    accuracy = {task_id: float(hits[task_id] / counts[task_id]) for task_id in np.flatnonzero(counts).tolist()}
+    return correct, invalid, accuracy
+
+
+if np is not None:
+    _CLASSES = _char_classes()
+    _POW10 = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+    # Класс символа -> часть записи (пробелы и цифры уточняются по положению)
+    _PARTS = np.array([_END, _LEAD, _SIGN_PART, _WHOLE, _POINT_PART, _OTHER_PART], dtype=np.int8)
+    # Части, которые не могут занимать две позиции подряд
+    _SINGLE = np.zeros(_OTHER_PART + 1, dtype=bool)
+    _SINGLE[[_SIGN_PART, _POINT_PART, _OTHER_PART]] = True
+    # Номер задания -> принимается ли только целое (задания 1 и 4 принимают и "-70,0")
+    _INTEGER_FORM = np.zeros(max(problems.PROBLEM_TYPES) + 1, dtype=bool)
+    for _task_id, _problem_type in problems.PROBLEM_TYPES.items():
+        _INTEGER_FORM[_task_id] = _problem_type.answer_form == "integer"
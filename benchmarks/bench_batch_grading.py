@@ -0,0 +1,72 @@
+"""Векторная проверка batch_grading против grading.grade_batch на заданиях с целым ответом.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_batch_grading.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_grading  # noqa: E402
+import grading  # noqa: E402
+import problems  # noqa: E402
+
+TASKS = tuple(batch_grading.BATCH_ANSWERS)
+
+
+def synthetic_inputs(n, seed=1):
+    """n пар (ключ, ответ): правильные, неправильные и неразборчивые ответы вперемешку."""
+    rng = np.random.default_rng(seed)
+    tasks = rng.choice(np.array(TASKS, dtype=np.uint64), size=n)
+    versions = np.array([problems.GENERATOR_VERSIONS.get(t, 0) for t in range(max(TASKS) + 1)], dtype=np.uint64)
+    seeds = rng.integers(0, 1 << problems.SEED_BITS, size=n, dtype=np.uint64)
+    keys = (
+        (tasks << np.uint64(problems.SEED_BITS + problems.VERSION_BITS))
+        | (versions[tasks] << np.uint64(problems.SEED_BITS))
+        | seeds
+    )
+    expected = batch_grading.answer_array(keys)
+
+    kind = rng.random(n)
+    wrong = rng.integers(-200, 201, size=n).astype(str)
+    garbage = rng.choice(np.array(["", "-", "abc", "1/0", "2,5,1", " 7 "]), size=n)
+    answers = np.where(kind < 0.5, expected.astype(str), np.where(kind < 0.9, wrong, garbage))
+    return keys, answers
+
+
+def main_bench(n=2000000, check=200000):
+    keys, answers = synthetic_inputs(n)
+    answer_list = answers.tolist()
+
+    started = time.perf_counter()
+    batch_grading.answer_array(keys)
+    t_answers = time.perf_counter() - started
+
+    started = time.perf_counter()
+    correct, invalid, accuracy = batch_grading.grade_arrays(keys, answer_list)
+    t_vector = time.perf_counter() - started
+
+    # Проверка по одному: условия восстанавливаются по ключам и проверяются через grading
+    sample = [problems.problem_from_key(int(key)) for key in keys[:check]]
+    started = time.perf_counter()
+    verdicts = grading.grade_batch(sample, answer_list[:check])
+    t_scalar = time.perf_counter() - started
+
+    mismatches = sum(
+        (verdict == grading.CORRECT) != ok or (verdict == grading.INVALID) != bad
+        for verdict, ok, bad in zip(verdicts, correct[:check].tolist(), invalid[:check].tolist())
+    )
+    print(f"{'способ':<34}{'строк/с':>12}")
+    print(f"{'answer_array (ответы по ключам)':<34}{n / t_answers:>12.0f}")
+    print(f"{'grade_arrays (ответы + разбор)':<34}{n / t_vector:>12.0f}")
+    print(f"{'grading.grade_batch':<34}{check / t_scalar:>12.0f}  (без восстановления условий)")
+    print(f"Расхождений с grading: {mismatches} из {check}")
+    print("Доля правильных:", ", ".join(f"{task}: {share:.3f}" for task, share in accuracy.items()))
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,159 @@
+"""Микробенчмарки генераторов заданий: задержка одного вызова до и после оптимизаций.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_generators.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch  # noqa: E402
+import problems  # noqa: E402
+
+
+def legacy_task5():
+    # Прежняя реализация Task5.generate_task: перегенерация C и D во float
+    a = random.randint(10, 25)
+    b = random.randint(8, a - 1)
+    denominator = a - b
+    while True:
+        c = round(random.uniform(1.1, 9.9), 1)
+        d = round(random.uniform(1.1, 9.9), 1)
+        x = (c + d) / denominator
+        rounded_x = round(x, 1)
+        if abs(x - rounded_x) < 1e-9:
+            return a, b, c, d, rounded_x
+
+
+def tenths_task5():
+    a = random.randint(10, 25)
+    b = random.randint(8, a - 1)
+    denominator = a - b
+    tenths_c, tenths_d = random.choice(problems.task5_pairs(denominator))
+    return a, b, tenths_c / 10, tenths_d / 10, (tenths_c + tenths_d) // denominator / 10
+
+
+def legacy_task6():
+    # Прежняя реализация Task6.generate_task: перегенерация до t2 < 10 и t2 = X.5
+    def draw():
+        return random.randint(10, 99) * 10, random.randint(2, 8), random.choice([5, 10, 15, 20, 25])
+
+    a, b, c = draw()
+    while True:
+        speed2 = a / b - c
+        if speed2 == 0:
+            a, b, c = draw()
+            continue
+        t2 = a / speed2
+        if t2 >= 10:
+            a, b, _ = draw()
+            continue
+        rounded_t2 = round(t2, 1)
+        if abs(t2 - rounded_t2) < 1e-9 and (rounded_t2 * 10) % 10 == 5:
+            return a, b, c, rounded_t2
+        a, b, c = draw()
+
+
+def constructive_task6():
+    space, cum_weights = problems.task6_space()
+    return random.choices(space, cum_weights=cum_weights)[0]
+
+
+def legacy_task7():
+    # Прежняя реализация Task7.generate_task: перегенерация до ответа -1/N
+    while True:
+        frac_b, frac_v, frac_g, frac_d, e = problems.draw_task7_fractions()
+        result = (1 + frac_b) * (frac_v + frac_g) - frac_d / e
+        if result < 0 and result.numerator == -1 and 2 <= result.denominator <= 9:
+            return frac_b, frac_v, frac_g, frac_d, e
+
+
+def catalog_task7():
+    return problems.task7_catalog().sample()
+
+
+def legacy_task8():
+    # Прежняя реализация Task8.generate_task: перегенерация y и a до кратности
+    b = random.randint(2, 6)
+    y = random.randint(6, 25)
+    while y % b != 0:
+        y = random.randint(6, 25)
+    x = y // b
+    a = random.randint(100, 999)
+    while a % x != 0:
+        a = random.randint(100, 999)
+    return a, b, y
+
+
+def table_task8():
+    b = random.randint(2, 6)
+    y = random.choice(problems.task8_floors(b))
+    return random.choice(problems.task8_table()[(b, y // b)]), b, y
+
+
+def legacy_task9():
+    # Прежняя реализация Task9.generate_task: полный перебор на каждый вызов
+    valid_combinations = []
+    for a in range(20, 31):
+        for b in range(2, 10):
+            for v in range(20, 31):
+                if (a * v) % 100 != 0:
+                    continue
+                total = a + (a - b) + (a - (a * v // 100))
+                if 50 <= total <= 90:
+                    valid_combinations.append((a, b, v, total))
+    return random.choice(valid_combinations)
+
+
+def indexed_task9():
+    return random.choice(problems.task9_index())
+
+
+BENCHMARKS = [
+    ("task5", legacy_task5, tenths_task5),
+    ("task6", legacy_task6, constructive_task6),
+    ("task7", legacy_task7, catalog_task7),
+    ("task8", legacy_task8, table_task8),
+    ("task9", legacy_task9, indexed_task9),
+]
+
+
+def measure(func, number):
+    # Лучшее из нескольких повторов, в микросекундах на вызов
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main_bench(number=200):
+    print(f"{'задание':<10}{'до, мкс':>12}{'после, мкс':>14}{'до, ген/с':>14}{'после, ген/с':>16}{'ускорение':>12}")
+    for name, before, after in BENCHMARKS:
+        after()  # прогрев ленивых индексов
+        t_before = measure(before, number)
+        t_after = measure(after, number)
+        print(
+            f"{name:<10}{t_before:>12.2f}{t_after:>14.2f}"
+            f"{1e6 / t_before:>14.0f}{1e6 / t_after:>16.0f}{t_before / t_after:>11.1f}x"
+        )
+    print(f"Размер пространства задания 6: {len(problems.task6_space()[0])} условий")
+    print(f"Размер каталога задания 7: {len(problems.task7_catalog())} условий")
+
+
+def batch_bench(n=100000):
+    # Пакетная генерация NumPy против n вызовов скалярного генератора
+    if batch.np is None:
+        print("numpy не установлен, пакетная генерация пропущена")
+        return
+    print(f"\n{'задание':<10}{'скаляр, ген/с':>16}{'пакет, ген/с':>16}{'ускорение':>12}")
+    for task in sorted(batch.BATCH_GENERATORS):
+        generator = problems.GENERATORS[task]
+        t_scalar = min(timeit.repeat(lambda: [generator() for _ in range(n)], number=1, repeat=3))
+        t_batch = min(timeit.repeat(lambda: batch.generate_batch(task, n, seed=1), number=1, repeat=3))
+        print(f"task{task:<6}{n / t_scalar:>16.0f}{n / t_batch:>16.0f}{t_scalar / t_batch:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main_bench()
+    batch_bench()
@@ -0,0 +1,88 @@
+"""Пропускная способность проверки ответов: grading против прежних проверок из check_answer.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_grading.py
+"""
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import grading  # noqa: E402
+import problems  # noqa: E402
+
+
+def legacy_grade(p, text):
+    # Прежний разбор из Task1–Task10.check_answer (Task2 — два поля, здесь через "/")
+    t = p.task_id
+    try:
+        if t in (1, 4):
+            return grading.CORRECT if float(text.replace(",", ".")) == p.correct_answer else grading.WRONG
+        if t == 3:
+            ok = abs(float(text.replace(",", ".")) - p.correct_answer) < 1e-6
+            return grading.CORRECT if ok else grading.WRONG
+        if t in (5, 6):
+            ok = abs(float(text.replace(",", ".")) - p.correct_answer) < 1e-9
+            return grading.CORRECT if ok else grading.WRONG
+        if t in (8, 9, 10):
+            return grading.CORRECT if int(text.strip()) == p.correct_answer else grading.WRONG
+        parts = text.strip().split("/")
+        if len(parts) != 2:
+            raise ValueError(text)
+        ok = Fraction(int(parts[0]), int(parts[1])) == p.correct_answer
+        return grading.CORRECT if ok else grading.WRONG
+    except (ValueError, ZeroDivisionError):
+        return grading.INVALID
+
+
+def synthetic_inputs(n, seed=1):
+    """n пар (условие, ответ): правильные, неправильные и неразборчивые ответы вперемешку."""
+    rng = random.Random(seed)
+    pool = [problems.generate(task, rng) for task in range(1, 11) for _ in range(100)]
+    items, answers = [], []
+    for _ in range(n):
+        p = rng.choice(pool)
+        kind = rng.random()
+        if kind < 0.5:
+            text = p.answer_text().replace(".", ",")
+        elif kind < 0.6:
+            exact = p.exact_answer()
+            text = f"{exact.numerator}/{exact.denominator}"
+        elif kind < 0.9:
+            text = str(rng.randint(-200, 200))
+        else:
+            text = rng.choice(["", "-", "abc", "1/0", "2,5,1"])
+        items.append(p)
+        answers.append(text)
+    return items, answers
+
+
+def main_bench(n=1000000):
+    items, answers = synthetic_inputs(n)
+
+    started = time.perf_counter()
+    verdicts = grading.grade_batch(items, answers)
+    t_batch = time.perf_counter() - started
+
+    started = time.perf_counter()
+    single = [grading.grade(p, text) for p, text in zip(items, answers)]
+    t_single = time.perf_counter() - started
+
+    started = time.perf_counter()
+    legacy = [legacy_grade(p, text) for p, text in zip(items, answers)]
+    t_legacy = time.perf_counter() - started
+
+    assert single == verdicts
+    mismatches = sum(a != b for a, b in zip(legacy, verdicts))
+    print(f"{'способ':<26}{'ответов/с':>12}")
+    print(f"{'прежние check_answer':<26}{n / t_legacy:>12.0f}")
+    print(f"{'grading.grade':<26}{n / t_single:>12.0f}")
+    print(f"{'grading.grade_batch':<26}{n / t_batch:>12.0f}")
+    print(f"Расхождений с прежней проверкой: {mismatches} из {n}")
+
+
+if __name__ == "__main__":
+    main_bench()
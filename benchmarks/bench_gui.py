@@ -0,0 +1,240 @@
+"""Бенчмарки интерфейса без экрана (платформа offscreen).
+
+Запуск из корня репозитория:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_gui.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEvent, QObject  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QWidget  # noqa: E402
+
+import formulas  # noqa: E402
+import main  # noqa: E402
+import problems  # noqa: E402
+
+FRAME_MS = 16  # Перетаскивание ползунка с частотой 60 кадров/с
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+class FirstPaint(QObject):
+    """Запоминает момент первого события Paint в приложении."""
+
+    def __init__(self):
+        super().__init__()
+        self.painted_at = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.painted_at is None:
+            self.painted_at = time.perf_counter()
+        return False
+
+
+def time_to_first_paint(app, eager, repeat=5):
+    """Медиана времени от создания окна до первой отрисовки, мс."""
+    samples = []
+    for _ in range(repeat):
+        watcher = FirstPaint()
+        app.installEventFilter(watcher)
+        started = time.perf_counter()
+        window = main.MathTrainer()
+        if eager:
+            # Прежнее поведение: все десять заданий строятся до показа окна
+            for index in main.TASK_FACTORIES:
+                window.task_widget(index)
+        window.show()
+        while watcher.painted_at is None:
+            app.processEvents()
+        samples.append((watcher.painted_at - started) * 1000)
+        app.removeEventFilter(watcher)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return percentile(samples, 50)
+
+
+def warm_up_bench(app):
+    """Прогрев в простое: сколько длится самый долгий такт и когда готовы все задания."""
+    window = main.MathTrainer()
+    window.show()
+    app.processEvents()
+    ticks = []
+    started = time.perf_counter()
+    window.warm_up_timer.start()
+    while window.warm_up_timer.isActive():
+        tick = time.perf_counter()
+        app.processEvents()
+        ticks.append((time.perf_counter() - tick) * 1000)
+    total = (time.perf_counter() - started) * 1000
+    window.close()
+    return len(window.tasks), max(ticks), total
+
+
+def widget_count(app):
+    """Сколько виджетов в окне, когда созданы все задания."""
+    window = main.MathTrainer()
+    for index in main.TASK_FACTORIES:
+        window.task_widget(index)
+    count = len(window.findChildren(QWidget))
+    window.close()
+    return count
+
+
+def startup_bench(app):
+    eager = time_to_first_paint(app, eager=True)
+    lazy = time_to_first_paint(app, eager=False)
+    print(f"{'запуск':<18}{'до отрисовки, мс':>18}")
+    print(f"{'все сразу':<18}{eager:>18.1f}")
+    print(f"{'по требованию':<18}{lazy:>18.1f}")
+    print(f"виджетов в окне со всеми заданиями: {widget_count(app)}")
+    built, longest, total = warm_up_bench(app)
+    print(f"прогрев в простое: {built} заданий за {total:.0f} мс, самый долгий такт {longest:.1f} мс\n")
+
+
+def switch_bench(app, window, rounds=20):
+    """Задержка переключения заданий (select_task и отрисовка), мс."""
+    for index in main.TASK_FACTORIES:
+        window.task_widget(index)
+
+    # Считаем обращения за условиями: на переключение должно приходиться ровно одно
+    generated = []
+    get = window.prefetcher.get
+
+    def counting_get(task_id):
+        generated.append(task_id)
+        return get(task_id)
+
+    window.prefetcher.get = counting_get
+    samples = []
+    for _ in range(rounds):
+        for index in main.TASK_FACTORIES:
+            del generated[:]
+            started = time.perf_counter()
+            window.select_task(index)
+            app.processEvents()
+            samples.append((time.perf_counter() - started) * 1000)
+            assert generated == [index], f"переключение на {index} сгенерировало {generated}"
+    window.prefetcher.get = get
+    print(f"переключение задания: p50 {percentile(samples, 50):.2f} мс, p95 {percentile(samples, 95):.2f} мс, "
+          f"макс {max(samples):.2f} мс ({len(samples)} переключений, по одному условию на каждое)")
+
+    # Перерисовки: при неизменном масштабе их нет; после его смены — по одной на задание
+    window.restyles.clear()
+    for index in main.TASK_FACTORIES:
+        window.select_task(index)
+    unchanged = dict(window.restyles)
+    window.restyles.clear()
+    text_scale = window.text_scale
+    window.apply_text_scaling(text_scale + 0.1)
+    for _ in range(2):
+        for index in main.TASK_FACTORIES:
+            window.select_task(index)
+    changed = dict(window.restyles)
+    window.apply_text_scaling(text_scale)
+    print(f"перерисовки без смены масштаба: {unchanged}; после смены масштаба, два круга: {changed}\n")
+
+
+def formula_bench(app, window, count=10, rounds=5):
+    """Вывод формулы заданий 2 и 7: разбор HTML в QLabel против кэша картинок, мкс на условие."""
+    formulas.FORMULA_CACHE = formulas.FormulaCache()
+    print(f"{'формула':<10}{'HTML, мкс':>12}{'кэш, мкс':>12}")
+    for index in formulas.FORMULA_HTML:
+        label = window.task_widget(index).label
+        font = label.font()
+        items = [problems.generate(index) for _ in range(count)]
+        # Как при перетаскивании ползунка: условия повторяются при двух масштабах
+        scales = [1.0, 1.2] * rounds
+
+        started = time.perf_counter()
+        for scale in scales:
+            for p in items:
+                label.setText(formulas.formula_html(p, scale))
+                label.sizeHint()
+        html = (time.perf_counter() - started) / (len(scales) * count) * 1e6
+
+        started = time.perf_counter()
+        for scale in scales:
+            for p in items:
+                label.setPixmap(formulas.FORMULA_CACHE.pixmap(p, scale, font))
+                label.sizeHint()
+        cached = (time.perf_counter() - started) / (len(scales) * count) * 1e6
+        print(f"task{index:<6}{html:>12.0f}{cached:>12.0f}")
+    print(f"кэш формул: {formulas.FORMULA_CACHE.stats()}\n")
+
+
+def drag_slider(app, slider, start, stop, settle_ms=300):
+    """Тянет ползунок от start до stop по одному делению за кадр; возвращает длительности кадров в мс."""
+    frames = []
+
+    def frame(step):
+        started = time.perf_counter()
+        step()
+        app.processEvents()
+        elapsed = time.perf_counter() - started
+        frames.append(elapsed * 1000)
+        time.sleep(max(0.0, FRAME_MS / 1000 - elapsed))
+
+    slider.setSliderDown(True)
+    for value in range(start, stop + 1):
+        frame(lambda: slider.setSliderPosition(value))
+    frame(lambda: slider.setSliderDown(False))
+    # Даём сработать отложенному применению после отпускания
+    for _ in range(settle_ms // FRAME_MS):
+        frame(lambda: None)
+    return frames
+
+
+def slider_bench(app, window):
+    """Длительность кадров при перетаскивании ползунка размера текста 50 → 200."""
+    restyles = []
+    apply_text_scaling = window.apply_text_scaling
+
+    def counting_apply(scale):
+        restyles.append(scale)
+        apply_text_scaling(scale)
+
+    window.apply_text_scaling = counting_apply
+    modes = [
+        ("каждое деление", 0, False),
+        (f"задержка {main.SettingsDialog.PREVIEW_DELAY_MS} мс", main.SettingsDialog.PREVIEW_DELAY_MS, False),
+        ("при отпускании", main.SettingsDialog.PREVIEW_DELAY_MS, True),
+    ]
+    print(f"{'режим':<18}{'рестайлов':>10}{'p50, мс':>10}{'p95, мс':>10}{'макс, мс':>10}")
+    for name, delay, on_release in modes:
+        dialog = main.SettingsDialog(window, 0.5, window.ui_scale, apply_on_release=on_release)
+        dialog.preview_timer.setInterval(delay)
+        dialog.show()
+        app.processEvents()
+        window.apply_text_scaling = apply_text_scaling
+        window.apply_text_scaling(0.5)
+        window.apply_text_scaling = counting_apply
+        restyles.clear()
+
+        frames = drag_slider(app, dialog.text_scale_slider, 50, 200)
+        dialog.accept()
+        print(
+            f"{name:<18}{len(restyles):>10}{percentile(frames, 50):>10.1f}"
+            f"{percentile(frames, 95):>10.1f}{max(frames):>10.1f}"
+        )
+    window.apply_text_scaling = apply_text_scaling
+    window.apply_text_scaling(1.0)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    startup_bench(app)
+    window = main.MathTrainer()
+    window.show()
+    app.processEvents()
+    switch_bench(app, window)
+    formula_bench(app, window)
+    slider_bench(app, window)
+    window.close()
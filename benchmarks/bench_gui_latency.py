@@ -0,0 +1,174 @@
+"""Набор замеров задержек интерфейса без экрана: p50/p95/p99 по каждой операции.
+
+Запуск из корня репозитория:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_gui_latency.py --output gui_latency.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_gui_latency.py --baseline gui_latency.json
+
+Замеряются select_task, reset_task и check_answer каждого задания, apply_text_scaling,
+apply_ui_scaling и длительность кадров при перетаскивании ползунка в окне настроек.
+Каждый замер включает обработку событий (перерисовку). С --baseline результаты
+сравниваются с сохранённым прогоном; если p95 какой-то операции вырос больше чем
+на --tolerance, скрипт завершается с кодом 1. Сравнивать имеет смысл прогоны
+на одной машине; на загруженной машине лучше поднять --tolerance или --rounds.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QT_VERSION_STR  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+import main  # noqa: E402
+from bench_gui import drag_slider, percentile  # noqa: E402
+
+# Разница меньше этой (мс) считается шумом и не считается регрессией
+NOISE_MS = 1.0
+# Сколько первых повторов каждой операции отбрасывать (прогрев кэшей)
+WARMUP = 3
+
+
+def summarize(samples):
+    return {
+        "n": len(samples),
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "p99": round(percentile(samples, 99), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def timed(app, func):
+    """Время вызова func вместе с обработкой событий, мс."""
+    started = time.perf_counter()
+    func()
+    app.processEvents()
+    return (time.perf_counter() - started) * 1000
+
+
+def fill_answer(task):
+    """Вводит правильный ответ текущего условия, как это сделал бы ученик."""
+    answer = task.problem.correct_answer
+    if task.task_id == 2:
+        task.answer_num.setText(str(answer.numerator))
+        task.answer_den.setText(str(answer.denominator))
+    else:
+        task.input_field.setText(task.problem.answer_text().replace(".", ","))
+
+
+def run_suite(app, rounds):
+    window = main.MathTrainer()
+    window.show()
+    app.processEvents()
+    for index in main.TASK_FACTORIES:
+        window.task_widget(index)
+
+    samples = {"select_task": []}
+    for _ in range(WARMUP + rounds):
+        for index in main.TASK_FACTORIES:
+            samples["select_task"].append(timed(app, lambda: window.select_task(index)))
+    del samples["select_task"][:WARMUP * len(main.TASK_FACTORIES)]
+
+    for index in main.TASK_FACTORIES:
+        window.select_task(index)
+        task = window.current_task_widget
+        reset, check = [], []
+        for _ in range(WARMUP + rounds):
+            reset.append(timed(app, task.reset_task))
+            fill_answer(task)
+            check.append(timed(app, task.check_answer))
+            assert task.result_label.property("verdict") == "correct", f"задание {index}: {task.problem}"
+        samples[f"reset_task[{index}]"] = reset[WARMUP:]
+        samples[f"check_answer[{index}]"] = check[WARMUP:]
+
+    # Чередуем два значения, чтобы каждый вызов действительно перерисовывал окно
+    text_scale, ui_scale = window.text_scale, window.ui_scale
+    samples["apply_text_scaling"] = [
+        timed(app, lambda: window.apply_text_scaling(text_scale + 0.1 * (i % 2 == 0)))
+        for i in range(WARMUP + rounds)
+    ][WARMUP:]
+    samples["apply_ui_scaling"] = [
+        timed(app, lambda: window.apply_ui_scaling(ui_scale + 0.1 * (i % 2 == 0)))
+        for i in range(WARMUP + rounds)
+    ][WARMUP:]
+    window.apply_text_scaling(text_scale)
+    window.apply_ui_scaling(ui_scale)
+
+    # Полный проход ползунка 50 → 200 в обычном режиме окна настроек
+    dialog = main.SettingsDialog(window, 0.5, ui_scale)
+    dialog.show()
+    app.processEvents()
+    samples["slider_sweep"] = drag_slider(app, dialog.text_scale_slider, 50, 200)
+    dialog.accept()
+    window.apply_text_scaling(text_scale)
+
+    window.close()
+    return {name: summarize(values) for name, values in samples.items()}
+
+
+def compare(metrics, baseline, tolerance):
+    """Печатает сравнение с базовым прогоном; возвращает список операций с регрессией по p95."""
+    regressions = []
+    print(f"\n{'операция':<20}{'p95 база':>10}{'p95 сейчас':>12}{'изменение':>11}")
+    for name, stats in metrics.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<20}{'—':>10}{stats['p95']:>12.2f}{'новая':>11}")
+            continue
+        change = stats["p95"] / base["p95"] - 1 if base["p95"] else 0.0
+        slower = change > tolerance and stats["p95"] - base["p95"] > NOISE_MS
+        mark = "  медленнее" if slower else ""
+        print(f"{name:<20}{base['p95']:>10.2f}{stats['p95']:>12.2f}{change:>+10.0%}{mark}")
+        if slower:
+            regressions.append(name)
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Замеры задержек интерфейса без экрана.")
+    parser.add_argument("--rounds", type=int, default=30, help="повторов каждой операции")
+    parser.add_argument("--output", help="записать результаты в JSON-файл")
+    parser.add_argument("--baseline", help="JSON-файл прошлого прогона для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимый рост p95 (0.25 = 25%%)")
+    return parser
+
+
+def main_bench(argv=None):
+    args = build_parser().parse_args(argv)
+    app = QApplication(sys.argv[:1])
+    metrics = run_suite(app, args.rounds)
+
+    print(f"{'операция':<20}{'n':>5}{'p50, мс':>10}{'p95, мс':>10}{'p99, мс':>10}")
+    for name, stats in metrics.items():
+        print(f"{name:<20}{stats['n']:>5}{stats['p50']:>10.2f}{stats['p95']:>10.2f}{stats['p99']:>10.2f}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "qt": QT_VERSION_STR,
+                "platform": os.environ.get("QT_QPA_PLATFORM"),
+                "rounds": args.rounds,
+            },
+            "metrics": metrics,
+        }
+        with open(args.output, "w", encoding="utf-8") as out:
+            json.dump(report, out, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["metrics"]
+        regressions = compare(metrics, baseline, args.tolerance)
+        if regressions:
+            print(f"\nРегрессия p95: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
@@ -0,0 +1,81 @@
+"""Журнал попыток: задержка append() в вызывающем потоке, число fsync и восстановление хвоста.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_journal.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import grading  # noqa: E402
+import journal  # noqa: E402
+import problems  # noqa: E402
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+def main_bench(n=20000, pause=0.0001):
+    rng = random.Random(1)
+    items = [problems.generate(task, rng) for task in problems.GENERATORS for _ in range(20)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "attempts.journal")
+        log = journal.AttemptJournal(path)
+        expected = []
+        latencies = []
+        started = time.perf_counter()
+        for i in range(n):
+            p = rng.choice(items)
+            text = p.answer_text() if i % 2 else str(rng.randint(-99, 99))
+            verdict = grading.grade(p, text)
+            expected.append((p.task_id, p.key, text, verdict))
+            t = time.perf_counter()
+            log.append(p.task_id, p.key, text, verdict, rng.uniform(1, 60))
+            latencies.append((time.perf_counter() - t) * 1e6)
+            if pause:
+                time.sleep(pause)  # Попытки приходят не все сразу, как от учеников
+        log.close()
+        elapsed = time.perf_counter() - started
+        stats = log.stats()
+
+        size = os.path.getsize(path)
+        attempts = journal.read_journal(path)
+        assert [(a.task_id, a.key, a.text, a.verdict) for a in attempts] == expected
+        print(f"append(): p50 {percentile(latencies, 50):.1f} мкс, p99 {percentile(latencies, 99):.1f} мкс, "
+              f"max {max(latencies):.1f} мкс")
+        print(f"{n} попыток за {elapsed:.2f} с, fsync: {stats['syncs']}, "
+              f"{(size - journal.HEADER.size) / n:.1f} байт на попытку")
+
+        # Обрыв посреди записи: половина следующей записи в конце файла
+        torn = journal.encode_attempt(1, None, "-12", grading.WRONG, 3.0, time.time())
+        with open(path, "ab") as f:
+            f.write(torn[:len(torn) // 2])
+        log = journal.AttemptJournal(path)
+        log.append(1, None, "5", grading.CORRECT, 1.0)
+        log.close()
+        attempts = journal.read_journal(path)
+        assert len(attempts) == n + 1 and attempts[-1].text == "5"
+        print(f"Восстановление: отброшено байт хвоста {log.recovered}")
+
+        # Открытие большого журнала: конструктор не читает файл, хвост ищется с конца
+        with open(path, "ab") as f:
+            f.write(b"".join(journal.encode_attempt(1, None, "-12", grading.WRONG, 3.0, time.time())
+                             for _ in range(1000000 - n)))
+            f.write(torn[:len(torn) // 2])
+        t = time.perf_counter()
+        log = journal.AttemptJournal(path)
+        opened = time.perf_counter() - t
+        log.close()
+        elapsed = time.perf_counter() - t
+        print(f"Журнал {os.path.getsize(path) / 2**20:.0f} МБ: конструктор {opened * 1e3:.2f} мс, "
+              f"открытие и восстановление {elapsed * 1e3:.1f} мс, отброшено байт {log.recovered}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,42 @@
+"""Ключи условий: размер записи и скорость восстановления условия по ключу.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_keys.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bulk  # noqa: E402
+import problems  # noqa: E402
+
+
+def main_bench(n=20000):
+    rng = random.Random(1)
+    print(f"{'задание':<9}{'JSONL, Б':>10}{'ключ, Б':>9}{'сжатие':>8}{'восст./с':>11}{'Random(seed)/с':>16}")
+    for task in problems.GENERATORS:
+        items = [problems.generate(task, rng) for _ in range(n)]
+        keys = [p.key for p in items]
+        jsonl = len(bulk.format_problems(items, "jsonl").encode("utf-8")) / n
+        packed = len(bulk.format_problems(items, "keys")) / n
+
+        started = time.perf_counter()
+        restored = [problems.problem_from_key(key) for key in problems.unpack_keys(problems.pack_keys(keys))]
+        t_keys = time.perf_counter() - started
+        assert restored == items, f"задание {task}: условие не восстановилось по ключу"
+
+        # Для сравнения: прежнее восстановление через random.Random(seed)
+        generator = problems.GENERATORS[task]
+        started = time.perf_counter()
+        for seed in range(n):
+            generator(random.Random(seed))
+        t_random = time.perf_counter() - started
+
+        print(f"{task:<9}{jsonl:>10.1f}{packed:>9.0f}{jsonl / packed:>7.1f}x{n / t_keys:>11.0f}{n / t_random:>16.0f}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,154 @@
+"""Массовая генерация условий без интерфейса.
+
+    python main.py generate --task 7 --count 1000000 --workers 8 --seed 42 > task7.jsonl
+
+Задания генерируются блоками по CHUNK_SIZE штук; у каждого блока свой генератор
+случайных чисел, зависящий только от --seed и номера блока. Поэтому результат
+не меняется от числа процессов, а блоки записываются в исходном порядке.
+
+У каждого условия есть ключ (см. problems.make_key), он пишется в столбец key.
+Формат keys пишет только ключи, по KEY_SIZE байт на условие: условия и ответы
+восстанавливаются из них функцией problems.problem_from_key.
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+import problems
+
+CHUNK_SIZE = 10000
+FORMATS = ("jsonl", "csv", "keys")
+
+
+def chunk_rng(seed, chunk_index):
+    """Независимый воспроизводимый генератор для блока chunk_index."""
+    return random.Random((seed << 32) | chunk_index)
+
+
+def _json_value(value):
+    # Обыкновенные дроби записываем строкой "p/q"
+    if isinstance(value, Fraction):
+        return str(value)
+    return value
+
+
+def _key_text(p):
+    # Без каталога условия задания 7 ключа не имеют (см. problems.generate)
+    return problems.key_text(p.key) if p.key is not None else ""
+
+
+def format_header(task_id, fmt):
+    if fmt == "keys":
+        return b""
+    if fmt != "csv":
+        return ""
+    names = problems.PROBLEM_TYPES[task_id].param_names
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerow(("task", "key") + names + ("answer",))
+    return out.getvalue()
+
+
+def format_problems(items, fmt):
+    if fmt == "keys":
+        if any(p.key is None for p in items):
+            raise ValueError("условия без ключа нельзя записать в формате keys (каталог задания 7 недоступен?)")
+        return problems.pack_keys(p.key for p in items)
+    out = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(out, lineterminator="\n")
+        for p in items:
+            writer.writerow((p.task_id, _key_text(p)) + tuple(p.params().values()) + (p.answer_text(),))
+    else:
+        for p in items:
+            row = {"task": p.task_id, "key": _key_text(p)}
+            row.update((name, _json_value(value)) for name, value in p.params().items())
+            row["answer"] = p.answer_text()
+            out.write(json.dumps(row, ensure_ascii=False))
+            out.write("\n")
+    return out.getvalue()
+
+
+def generate_chunk(job):
+    """Генерирует и форматирует один блок; выполняется в рабочем процессе."""
+    task_id, seed, chunk_index, count, fmt = job
+    rng = chunk_rng(seed, chunk_index)
+    return format_problems([problems.generate(task_id, rng) for _ in range(count)], fmt)
+
+
+def iter_jobs(task_id, seed, count, fmt):
+    for chunk_index, start in enumerate(range(0, count, CHUNK_SIZE)):
+        yield task_id, seed, chunk_index, min(CHUNK_SIZE, count - start), fmt
+
+
+def run(task_id, count, workers, seed, fmt, out):
+    """Пишет count условий задания task_id в out; возвращает затраченное время в секундах."""
+    # Прогреваем ленивые таблицы до запуска процессов, чтобы они достались им готовыми
+    problems.generate(task_id, random.Random(seed))
+
+    started = time.perf_counter()
+    out.write(format_header(task_id, fmt))
+    jobs = iter_jobs(task_id, seed, count, fmt)
+    if workers <= 1:
+        for job in jobs:
+            out.write(generate_chunk(job))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for text in pool.imap(generate_chunk, jobs):
+                out.write(text)
+    out.flush()
+    return time.perf_counter() - started
+
+
+def seed_value(text):
+    # random.Random берёт модуль зерна, поэтому -1 и 1 дали бы одинаковый вывод
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"зерно должно быть целым числом: {text!r}") from None
+    if seed < 0:
+        raise argparse.ArgumentTypeError(f"зерно должно быть неотрицательным: {seed}")
+    return seed
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py generate", description="Массовая генерация заданий без интерфейса.")
+    parser.add_argument("--task", type=int, required=True, choices=sorted(problems.GENERATORS), help="номер задания")
+    parser.add_argument("--count", type=int, default=1000, help="сколько условий сгенерировать")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="число процессов")
+    parser.add_argument("--seed", type=seed_value, default=None, help="зерно генератора (по умолчанию случайное)")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl", help="формат вывода")
+    parser.add_argument("--output", default="-", help="файл для записи, '-' — стандартный вывод")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    seed = args.seed if args.seed is not None else random.getrandbits(32)
+
+    binary = args.format == "keys"
+    if args.output == "-":
+        out = sys.stdout.buffer if binary else sys.stdout
+        elapsed = run(args.task, args.count, args.workers, seed, args.format, out)
+    else:
+        mode = {"mode": "wb"} if binary else {"mode": "w", "encoding": "utf-8", "newline": ""}
+        with open(args.output, **mode) as out:
+            elapsed = run(args.task, args.count, args.workers, seed, args.format, out)
+
+    rate = args.count / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"Задание {args.task}: {args.count} условий за {elapsed:.2f} с "
+        f"({rate:.0f} условий/с, процессов: {args.workers}, seed={seed})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Проверка собранных ответов без интерфейса.
+
+    python main.py grade answers.csv --output results.csv --summary summary.json
+
+Каждая строка входного файла (CSV с заголовком или JSONL) — один ответ ученика:
+    key             ключ условия (16 шестнадцатеричных цифр, как его пишет generate), или
+    task и seed     номер задания и зерно, или
+    task и <параметры>  параметры условия под теми же именами, что пишет generate;
+    student_answer  ответ ученика как он был введён.
+Условие восстанавливается по ключу, зерну или параметрам и проверяется по тем же
+правилам, что и check_answer в приложении (см. grading). Строки читаются и
+пишутся потоком блоками по CHUNK_SIZE, поэтому память не зависит от размера файла.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import Counter
+
+import grading
+import problems
+
+CHUNK_SIZE = 10000
+FORMATS = ("jsonl", "csv")
+ERROR = "error"  # Вердикт строки, условие которой не удалось восстановить
+OUTPUT_FIELDS = ("row", "task", "student_answer", "correct_answer", "verdict", "error")
+
+
+def detect_format(path, fmt):
+    if fmt is not None:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def read_rows(f, fmt):
+    """Строки входного файла: словари для CSV, неразобранный текст строки для JSONL.
+
+    JSONL разбирается в parse_row, чтобы одна испорченная строка стала ошибкой
+    этой строки, а не остановила проверку всего файла.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+        return
+    for line in f:
+        if line.strip():
+            yield line
+
+
+def parse_row(row):
+    """Словарь строки; для JSONL разбирает её текст."""
+    if isinstance(row, str):
+        row = json.loads(row)
+    if not isinstance(row, dict):
+        raise TypeError(f"строка должна быть объектом JSON, а не {type(row).__name__}")
+    return row
+
+
+def row_problem(row):
+    """Условие строки: по ключу, по зерну или по параметрам — что есть в строке."""
+    key = row.get("key")
+    if key not in (None, ""):
+        problem = problems.problem_from_key(problems.parse_key(key))
+        if row.get("task") not in (None, "") and int(row["task"]) != problem.task_id:
+            raise ValueError(f"ключ {key} относится к заданию {problem.task_id}")
+        return problem
+    task_id = int(row["task"])
+    if task_id not in problems.PROBLEM_TYPES:
+        raise ValueError(f"нет задания {task_id}")
+    seed = row.get("seed")
+    if seed not in (None, ""):
+        return problems.problem_from_seed(task_id, int(seed))
+    return problems.problem_from_params(task_id, row)
+
+
+def grade_chunk(start, rows):
+    """Проверяет блок строк; возвращает результаты в исходном порядке."""
+    results = []
+    for offset, row in enumerate(rows):
+        result = {"row": start + offset, "task": None, "student_answer": "",
+                  "correct_answer": "", "verdict": ERROR, "error": ""}
+        try:
+            row = parse_row(row)
+            answer = row.get("student_answer")
+            answer = "" if answer is None else str(answer)
+            result["task"] = row.get("task")
+            result["student_answer"] = answer
+            problem = row_problem(row)
+            # Ответ считаем здесь же: неудачные параметры могут сломать и его
+            correct_answer = problem.answer_text()
+            key = grading.answer_key(problem)
+        except (KeyError, ValueError, TypeError, ArithmeticError, AttributeError) as exc:
+            result["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            result["task"] = problem.task_id
+            result["correct_answer"] = correct_answer
+            result["verdict"] = grading.grade_key(key, answer)
+        results.append(result)
+    return results
+
+
+def iter_chunks(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Summary:
+    """Итоги по заданиям: сколько ответов каждого вердикта."""
+
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, results):
+        for result in results:
+            # "?" — строки, номер задания которых прочитать не удалось
+            task = "?" if result["task"] is None else str(result["task"])
+            self.counts.setdefault(task, Counter())[result["verdict"]] += 1
+
+    def as_dict(self):
+        report = {}
+        # Номера заданий по возрастанию, нераспознанные — в конце
+        for task in sorted(self.counts, key=lambda t: (not t.isdigit(), t.zfill(8))):
+            counts = self.counts[task]
+            total = sum(counts.values())
+            report[task] = {
+                "total": total,
+                **{verdict: counts[verdict] for verdict in grading.VERDICTS + (ERROR,)},
+                "accuracy": round(counts[grading.CORRECT] / total, 4),
+            }
+        return report
+
+
+def run(src, out, in_fmt, out_fmt):
+    """Проверяет все строки из src и пишет результаты в out; возвращает (итоги, число строк)."""
+    summary = Summary()
+    writer = None
+    if out_fmt == "csv":
+        writer = csv.DictWriter(out, OUTPUT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+    start = 0
+    for chunk in iter_chunks(read_rows(src, in_fmt)):
+        results = grade_chunk(start, chunk)
+        start += len(chunk)
+        summary.add(results)
+        if writer is not None:
+            writer.writerows(results)
+        else:
+            for result in results:
+                out.write(json.dumps(result, ensure_ascii=False))
+                out.write("\n")
+    out.flush()
+    return summary, start
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py grade", description="Проверка собранных ответов без интерфейса.")
+    parser.add_argument("input", help="файл с ответами (CSV или JSONL), '-' — стандартный ввод")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="формат входа (по умолчанию по расширению)")
+    parser.add_argument("--output", default="-", help="файл результатов, '-' — стандартный вывод")
+    parser.add_argument("--output-format", choices=FORMATS, default=None, help="формат результатов (по умолчанию как вход)")
+    parser.add_argument("--summary", default=None, help="записать итоги по заданиям в JSON-файл")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    in_fmt = detect_format(args.input, args.format)
+    out_fmt = args.output_format or (detect_format(args.output, None) if args.output != "-" else in_fmt)
+
+    started = time.perf_counter()
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        summary, rows = run(src, out, in_fmt, out_fmt)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - started
+
+    report = summary.as_dict()
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    for task, stats in report.items():
+        print(
+            f"Задание {task}: {stats['total']} ответов, верно {stats[grading.CORRECT]}, "
+            f"неверно {stats[grading.WRONG]}, не разобрано {stats[grading.INVALID]}, "
+            f"ошибок в строках {stats[ERROR]}",
+            file=sys.stderr,
+        )
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    print(f"Проверено {rows} строк за {elapsed:.2f} с ({rate:.0f} строк/с)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
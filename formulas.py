@@ -0,0 +1,107 @@
+"""Готовые картинки формул с дробями для заданий 2 и 7.
+
+Формула с <sup>/<sub> задаётся HTML, и QLabel разбирает его при каждом setText,
+в том числе при каждой смене масштаба. Здесь HTML разбирается и раскладывается
+один раз, а результат хранится как QPixmap с ключом
+(номер задания, параметры условия, text_scale). Кэш ограничен по памяти:
+при превышении FORMULA_CACHE_BYTES вытесняются давно не использованные картинки.
+"""
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication, QPainter, QPixmap, QTextDocument
+
+FORMULA_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def _fraction(num, den):
+    return f"<sup>{num}</sup>&frasl;<sub>{den}</sub>"
+
+
+def task2_html(p):
+    # (a/b – c/d) ÷ e/f
+    return (
+        f"({_fraction(p.a, p.b)} &minus; {_fraction(p.c, p.d)}) &divide; {_fraction(p.e, p.f)}"
+    )
+
+
+def task7_html(p):
+    # 1 b × (v + g) – d ÷ e
+    return (
+        f"1{_fraction(p.frac_b.numerator, p.frac_b.denominator)} &times; "
+        f"({_fraction(p.frac_v.numerator, p.frac_v.denominator)} + "
+        f"{_fraction(p.frac_g.numerator, p.frac_g.denominator)}) &minus; "
+        f"{_fraction(p.frac_d.numerator, p.frac_d.denominator)} &divide; {p.e}"
+    )
+
+
+FORMULA_HTML = {
+    2: task2_html,
+    7: task7_html,
+}
+
+
+def formula_html(p, text_scale):
+    """HTML формулы условия p с размером шрифта для text_scale."""
+    return (
+        f'<div style="text-align: center;">'
+        f'<span style="font-size: {int(60 * text_scale)}px;">{FORMULA_HTML[p.task_id](p)}</span>'
+        f"</div>"
+    )
+
+
+def _render(html, font):
+    document = QTextDocument()
+    document.setDefaultFont(font)
+    document.setDocumentMargin(0)
+    document.setHtml(html)
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    size = document.size()
+    pixmap = QPixmap(int(size.width() * ratio) + 1, int(size.height() * ratio) + 1)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    document.drawContents(painter)
+    painter.end()
+    return pixmap
+
+
+def _pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class FormulaCache:
+    def __init__(self, max_bytes=FORMULA_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._pixmaps = OrderedDict()
+
+    def pixmap(self, p, text_scale, font):
+        """Картинка формулы условия p шрифтом font; разбирает HTML только при промахе кэша.
+
+        Семейство шрифта во всём приложении одно, поэтому в ключ оно не входит.
+        """
+        key = (p.task_id, tuple(p.params().values()), text_scale)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        self.misses += 1
+        pixmap = _render(formula_html(p, text_scale), font)
+        self._pixmaps[key] = pixmap
+        self.bytes += _pixmap_bytes(pixmap)
+        # Вытесняем давно не использованные, но последнюю картинку оставляем всегда
+        while self.bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, old = self._pixmaps.popitem(last=False)
+            self.bytes -= _pixmap_bytes(old)
+        return pixmap
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._pixmaps), "bytes": self.bytes}
+
+
+FORMULA_CACHE = FormulaCache()
@@ -0,0 +1,123 @@
+"""Единая проверка ответов: разбор ввода ученика в точную дробь и сравнение с ответом.
+
+Ввод разбирается одним регулярным выражением в пару целых (числитель, знаменатель):
+целое число ("-12"), десятичная дробь через запятую или точку ("3,5", "-0.25")
+или обыкновенная дробь со знаком ("-1/9"). Какие виды записи принимаются, задаёт
+answer_form условия (см. FORM_SHAPES). Ответ сравнивается точно, без float:
+p/q == r/s проверяется как p·s == r·q.
+
+Итог проверки — одно из VERDICTS; эти же строки интерфейс использует как
+свойство verdict у надписи с результатом.
+"""
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+CORRECT = "correct"
+WRONG = "wrong"
+INVALID = "invalid"
+VERDICTS = (CORRECT, WRONG, INVALID)
+
+# Вид записи -> какие формы ввода для него допустимы
+FORM_SHAPES = {
+    "integer": ("integer",),
+    "decimal": ("integer", "decimal"),
+    "fraction": ("fraction",),
+}
+
+# Длиннее ответ ученика быть не может; заодно не даём int() разбирать огромные строки
+MAX_INPUT_LENGTH = 64
+# Ответы учеников часто совпадают ("-81", "3,5"), поэтому разбор кэшируется
+PARSE_CACHE_SIZE = 65536
+
+_ANSWER_RE = re.compile(
+    r"\s*([+-]?)"
+    r"(?:(\d+)(?:([.,])(\d*))?|[.,](\d+))"  # целая часть и дробная после запятой
+    r"(?:\s*/\s*([+-]?)(\d+))?"  # знаменатель обыкновенной дроби
+    r"\s*"
+)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_rational(text):
+    """Разбирает ввод в (числитель, знаменатель, вид) или возвращает None.
+
+    Вид — "integer", "decimal" или "fraction"; знаменатель всегда положителен,
+    но дробь не сокращается.
+    """
+    if len(text) > MAX_INPUT_LENGTH:
+        return None
+    m = _ANSWER_RE.fullmatch(text)
+    if m is None:
+        return None
+    sign, whole, point, digits, bare_digits, den_sign, den = m.groups()
+    if den is not None:
+        # У обыкновенной дроби числитель и знаменатель целые
+        if point is not None or bare_digits is not None:
+            return None
+        num, den = int(whole), int(den)
+        if den == 0:
+            return None
+        if (sign == "-") != (den_sign == "-"):
+            num = -num
+        return num, den, "fraction"
+    if point is None and bare_digits is None:
+        num = int(whole)
+        return (-num if sign == "-" else num), 1, "integer"
+    digits = digits if bare_digits is None else bare_digits
+    num = int((whole or "0") + digits)
+    return (-num if sign == "-" else num), 10 ** len(digits), "decimal"
+
+
+def parse_answer(text, form="decimal"):
+    """Ввод ученика в виде Fraction или None, если он не подходит под вид записи form."""
+    parsed = parse_rational(text)
+    if parsed is None or parsed[2] not in FORM_SHAPES[form]:
+        return None
+    return Fraction(parsed[0], parsed[1])
+
+
+@lru_cache(maxsize=1024)
+def answer_key(problem):
+    """Заранее посчитанный ключ проверки условия: (числитель, знаменатель, допустимые формы)."""
+    exact = problem.exact_answer()
+    return exact.numerator, exact.denominator, FORM_SHAPES[problem.answer_form]
+
+
+def grade_key(key, text):
+    """Проверяет ввод text по ключу answer_key; возвращает один из VERDICTS."""
+    parsed = parse_rational(text)
+    if parsed is None:
+        return INVALID
+    num, den, shape = parsed
+    p, q, shapes = key
+    if shape not in shapes:
+        return INVALID
+    return CORRECT if num * q == p * den else WRONG
+
+
+def grade(problem, text):
+    """Проверяет ответ ученика text к условию problem."""
+    return grade_key(answer_key(problem), text)
+
+
+def grade_batch(problems, answers):
+    """Проверяет пары (условие, ответ); возвращает список вердиктов в том же порядке.
+
+    Ключ проверки считается один раз на каждый объект условия.
+    """
+    keys = {}
+    verdicts = []
+    for problem, text in zip(problems, answers):
+        # Ключ по id; сам объект храним рядом, чтобы его id не достался другому условию
+        entry = keys.get(id(problem))
+        if entry is None:
+            entry = keys[id(problem)] = (problem,) + answer_key(problem)
+        parsed = parse_rational(text)
+        if parsed is None or parsed[2] not in entry[3]:
+            verdicts.append(INVALID)
+        elif parsed[0] * entry[2] == entry[1] * parsed[1]:
+            verdicts.append(CORRECT)
+        else:
+            verdicts.append(WRONG)
+    return verdicts
@@ -0,0 +1,255 @@
+"""Журнал попыток: каждая проверка ответа дописывается в конец файла.
+
+AttemptJournal.append() только кладёт попытку в очередь, поэтому окно не ждёт
+диска. Фоновый поток открывает файл (и при необходимости восстанавливает его
+хвост), разбирает ввод, кодирует записи и дописывает их пачкой, делая не больше
+одного fsync за FSYNC_INTERVAL секунд.
+
+Файл: заголовок JOURNAL_MAGIC + версия, затем записи. Каждая запись — длина
+и CRC32 содержимого (FRAME), само содержимое (RECORD и ввод ученика в UTF-8)
+и ещё раз длина (TRAILER). Если программа или компьютер упали посреди записи,
+хвост файла может оказаться оборванным: recover() по TRAILER находит с конца
+последнюю целую запись и обрезает всё, что после неё, не читая весь журнал.
+"""
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+import grading
+
+JOURNAL_MAGIC = b"ATJL"
+JOURNAL_VERSION = 2
+HEADER = struct.Struct("<4sH")
+FRAME = struct.Struct("<HI")  # длина содержимого, CRC32 содержимого
+TRAILER = struct.Struct("<H")  # длина содержимого ещё раз — чтобы искать записи с конца
+# Задание, ключ условия, вердикт, флаги, числитель и знаменатель разобранного ввода,
+# время на размышление (мс), время попытки (мс с 1970 года), длина ввода в байтах
+RECORD = struct.Struct("<BQBBqQIQB")
+MAX_INPUT_BYTES = 255  # Длиннее ввод обрезается (флаг INPUT_TRUNCATED)
+FSYNC_INTERVAL = 0.5
+# Сколько последних байт просматривать при восстановлении; оборванная запись
+# всегда короче, так что обычно хватает одного шага с конца
+TAIL_WINDOW = 64 * 1024
+
+# Флаги записи
+PARSED = 1  # Ввод разобран, числитель и знаменатель заполнены
+INPUT_TRUNCATED = 2
+
+_INT64 = 1 << 63
+
+Attempt = namedtuple("Attempt", "task_id key verdict parsed think_ms time_ms text")
+
+
+def encode_attempt(task_id, key, text, verdict, think_time, timestamp):
+    """Одна запись журнала в байтах, вместе с длиной и CRC.
+
+    think_time — секунды от показа условия до проверки, timestamp — time.time() попытки.
+    """
+    # Одиночные суррогаты и прочее некодируемое заменяем, а не роняем запись
+    raw = text.encode("utf-8", errors="replace")
+    flags = 0
+    if len(raw) > MAX_INPUT_BYTES:
+        raw = raw[:MAX_INPUT_BYTES]
+        flags |= INPUT_TRUNCATED
+    num, den = 0, 0
+    parsed = grading.parse_rational(text)
+    # Очень длинные числа в запись не помещаются; их можно заново разобрать из ввода
+    if parsed is not None and -_INT64 <= parsed[0] < _INT64 and parsed[1] < 2 * _INT64:
+        num, den = parsed[0], parsed[1]
+        flags |= PARSED
+    payload = RECORD.pack(
+        task_id, key or 0, grading.VERDICTS.index(verdict), flags, num, den,
+        min(int(think_time * 1000), 0xFFFFFFFF), int(timestamp * 1000), len(raw),
+    ) + raw
+    return FRAME.pack(len(payload), zlib.crc32(payload)) + payload + TRAILER.pack(len(payload))
+
+
+def _scan(data):
+    """Содержимое целых записей после заголовка и смещение конца последней из них."""
+    records = []
+    offset = HEADER.size
+    while offset + FRAME.size <= len(data):
+        length, crc = FRAME.unpack_from(data, offset)
+        end = offset + FRAME.size + length + TRAILER.size
+        payload = data[offset + FRAME.size:offset + FRAME.size + length]
+        if end > len(data) or length < RECORD.size or zlib.crc32(payload) != crc:
+            break
+        if TRAILER.unpack_from(data, end - TRAILER.size)[0] != length:
+            break
+        records.append(payload)
+        offset = end
+    return records, offset
+
+
+def _tail_end(f, size):
+    """Конец последней целой записи, найденный с конца файла, или None, если в TAIL_WINDOW её нет."""
+    start = max(HEADER.size, size - TAIL_WINDOW)
+    f.seek(start)
+    data = f.read()
+    for end in range(len(data), TRAILER.size - 1, -1):
+        (length,) = TRAILER.unpack_from(data, end - TRAILER.size)
+        begin = end - TRAILER.size - length - FRAME.size
+        if length < RECORD.size or begin < 0:
+            continue
+        frame_length, crc = FRAME.unpack_from(data, begin)
+        if frame_length == length and zlib.crc32(data[begin + FRAME.size:end - TRAILER.size]) == crc:
+            return start + end
+    # Окно покрыло весь файл — целых записей нет вовсе
+    return HEADER.size if start == HEADER.size else None
+
+
+def _check_header(data, path):
+    magic, version = HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+        raise ValueError(f"Неподдерживаемый журнал попыток: {path}")
+
+
+def recover(path):
+    """Обрезает оборванный хвост журнала; возвращает число отброшенных байт."""
+    with open(path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < HEADER.size:
+            # Файл оборвался ещё на заголовке — начинаем журнал заново
+            f.seek(0)
+            f.truncate()
+            f.write(HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION))
+            f.flush()
+            os.fsync(f.fileno())
+            return size
+        _check_header(f.read(HEADER.size), path)
+        end = _tail_end(f, size)
+        if end is None:
+            # Испорченный кусок длиннее окна: проходим журнал целиком с начала
+            f.seek(0)
+            _, end = _scan(f.read())
+        if end < size:
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+        return size - end
+
+
+def read_journal(path):
+    """Все целые записи журнала в виде Attempt."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        return []
+    _check_header(data, path)
+    attempts = []
+    for payload in _scan(data)[0]:
+        task_id, key, verdict, flags, num, den, think_ms, time_ms, size = RECORD.unpack_from(payload)
+        text = payload[RECORD.size:RECORD.size + size].decode("utf-8", errors="replace")
+        parsed = (num, den) if flags & PARSED else None
+        attempts.append(Attempt(task_id, key or None, grading.VERDICTS[verdict], parsed, think_ms, time_ms, text))
+    return attempts
+
+
+class AttemptJournal:
+    def __init__(self, path, fsync_interval=FSYNC_INTERVAL):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.written = 0
+        self.syncs = 0
+        self.skipped = 0  # Попытки, которые не удалось закодировать
+        self.recovered = None  # Сколько байт оборванного хвоста отброшено при открытии
+        self.failed = None  # Ошибка фонового потока; после неё попытки больше не пишутся
+        self._file = None
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        # Файл открывается и проверяется уже в фоновом потоке, окно его не ждёт
+        self._thread = threading.Thread(target=self._run, name="attempt-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, task_id, key, text, verdict, think_time):
+        """Добавляет попытку в очередь записи; не ждёт диска.
+
+        think_time — секунды от показа условия до проверки.
+        """
+        with self._cond:
+            if self._closed or self.failed is not None:
+                return
+            self._pending.append((task_id, key, text, verdict, think_time, time.time()))
+            self._cond.notify()
+
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if os.path.exists(self.path):
+            try:
+                self.recovered = recover(self.path)
+            except ValueError:
+                # Чужой файл или журнал старого формата: сохраняем его рядом и начинаем новый
+                os.replace(self.path, self.path + ".old")
+        if not os.path.exists(self.path):
+            self.recovered = 0
+            with open(self.path, "wb") as f:
+                f.write(HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION))
+        self._file = open(self.path, "ab")
+
+    def _run(self):
+        try:
+            self._open()
+        except Exception as exc:
+            self._fail(exc)
+            return
+        last_sync = 0.0
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                # Копим попытки, пока не подойдёт время следующего fsync
+                deadline = last_sync + self.fsync_interval
+                while not self._closed and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+                batch, self._pending = self._pending, []
+                closed = self._closed
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as exc:
+                    self._fail(exc)
+                    return
+                last_sync = time.monotonic()
+            if closed:
+                return
+
+    def _fail(self, exc):
+        # Поток записи останавливается; ошибку видно в stats(), новые попытки не копятся
+        with self._cond:
+            self.failed = exc
+            self._pending = []
+
+    def _write(self, batch):
+        chunks = []
+        for attempt in batch:
+            try:
+                chunks.append(encode_attempt(*attempt))
+            except (ValueError, TypeError, OverflowError, struct.error):
+                # Одна испорченная попытка не должна стоить всей пачки
+                self.skipped += 1
+        self._file.write(b"".join(chunks))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.written += len(chunks)
+        self.syncs += 1
+
+    def stats(self):
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            "written": self.written, "syncs": self.syncs, "skipped": self.skipped,
+            "pending": pending, "failed": self.failed,
+        }
+
+    def close(self):
+        """Дописывает оставшиеся попытки и закрывает файл."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
@@ -1,22 +1,53 @@
 import sys
-import random
 import math
+import time
+
+# Момент запуска и длительность импортов — для --profile-startup
+STARTED = time.perf_counter()
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
     QPushButton, QLabel, QLineEdit, QGridLayout, QFrame, QScrollArea,
-    QDialog, QFormLayout, QSlider  # Добавлены для окна настроек
+    QDialog, QFormLayout, QSlider, QCheckBox,  # Добавлены для окна настроек
+    QStackedWidget
 )
-from PyQt5.QtCore import Qt, QSettings
-from PyQt5.QtGui import QFont, QPalette, QColor
-from fractions import Fraction
+from PyQt5.QtCore import Qt, QSettings, QStandardPaths, QTimer, QEvent, QObject, pyqtSignal
+from PyQt5.QtGui import QPalette, QColor
+
+PYQT_IMPORTED = time.perf_counter()
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import formulas
+import grading
+import journal
+import problems
+import styles
+from prefetch import DEFAULT_DEPTH, ProblemPrefetcher
+
+MODULES_IMPORTED = time.perf_counter()
 
 
 class SettingsDialog(QDialog):
-    def __init__(self, parent=None, text_scale=1.0, ui_scale=1.0):
+    # Задержка предпросмотра: пока ползунок двигается, масштаб применяется не чаще раза за PREVIEW_DELAY_MS
+    PREVIEW_DELAY_MS = 80
+
+    def __init__(self, parent=None, text_scale=1.0, ui_scale=1.0, apply_on_release=False):
         super().__init__(parent)
         self.setWindowTitle("Настройки")
         self.setGeometry(300, 300, 400, 200)
 
+        # Отложенное применение масштаба: новые значения копятся, таймер применяет последние
+        self.pending_text_scale = None
+        self.pending_ui_scale = None
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.apply_pending)
+
         layout = QFormLayout()
 
         self.text_scale_slider = QSlider(Qt.Horizontal)
@@ -33,60 +64,212 @@ class SettingsDialog(QDialog):
         self.ui_scale_slider.valueChanged.connect(self.on_ui_scale_changed)
         layout.addRow("Размер клавиатуры и кнопок:", self.ui_scale_slider)
 
+        # Для слабых компьютеров: масштаб меняется только когда ползунок отпущен
+        self.apply_on_release_box = QCheckBox("Применять, когда ползунок отпущен")
+        self.apply_on_release_box.setChecked(apply_on_release)
+        self.apply_on_release_box.toggled.connect(self.set_apply_on_release)
+        layout.addRow(self.apply_on_release_box)
+        self.set_apply_on_release(apply_on_release)
+
         close_button = QPushButton("Закрыть")
         close_button.clicked.connect(self.accept)
         layout.addRow(close_button)
 
         self.setLayout(layout)
 
+    def set_apply_on_release(self, enabled):
+        # Без отслеживания valueChanged приходит только при отпускании ползунка
+        self.text_scale_slider.setTracking(not enabled)
+        self.ui_scale_slider.setTracking(not enabled)
+
     def on_text_scale_changed(self, value):
-        scale = value / 100.0
-        self.parent().apply_text_scaling(scale)
+        self.pending_text_scale = value / 100.0
+        self.start_preview_timer()
 
     def on_ui_scale_changed(self, value):
-        scale = value / 100.0
-        self.parent().apply_ui_scaling(scale)
+        self.pending_ui_scale = value / 100.0
+        self.start_preview_timer()
+
+    def start_preview_timer(self):
+        # Таймер не перезапускаем: во время перетаскивания предпросмотр обновляется раз в PREVIEW_DELAY_MS
+        if not self.preview_timer.isActive():
+            self.preview_timer.start()
+
+    def apply_pending(self):
+        """Применяет последние значения ползунков, накопленные за время задержки."""
+        self.preview_timer.stop()
+        if self.pending_text_scale is not None:
+            self.parent().apply_text_scaling(self.pending_text_scale)
+            self.pending_text_scale = None
+        if self.pending_ui_scale is not None:
+            self.parent().apply_ui_scaling(self.pending_ui_scale)
+            self.pending_ui_scale = None
+
+    def done(self, result):
+        # Не теряем значение, выставленное прямо перед закрытием окна
+        self.apply_pending()
+        super().done(result)
+
+    def apply_on_release(self):
+        return self.apply_on_release_box.isChecked()
 
     def get_values(self):
         return self.text_scale_slider.value() / 100.0, self.ui_scale_slider.value() / 100.0
 
 
+class VirtualKeyboard(QWidget):
+    """Общая экранная клавиатура; нажатия передаются заданию через сигнал key_pressed."""
+    key_pressed = pyqtSignal(str)
+
+    KEYS = [
+        ['1', '2', '3'],
+        ['4', '5', '6'],
+        ['7', '8', '9'],
+        ['0', '-', ','],
+    ]
+
+    def __init__(self):
+        super().__init__()
+        layout = QGridLayout(self)
+        for i, row in enumerate(self.KEYS):
+            for j, char in enumerate(row):
+                btn = QPushButton(char)
+                btn.setObjectName("key")
+                # Кнопки не забирают фокус, чтобы он оставался в поле ответа
+                btn.setFocusPolicy(Qt.NoFocus)
+                btn.clicked.connect(lambda _, b=btn: self.key_pressed.emit(b.text()))
+                layout.addWidget(btn, i, j)
+        # Последняя клавиша зависит от задания: "," для десятичных дробей, "/" для обыкновенных
+        self.extra_key = layout.itemAtPosition(3, 2).widget()
+
+    def set_extra_key(self, char):
+        self.extra_key.setText(char)
+
+
 # Абстрактный базовый класс для задания
 class BaseTask(QWidget):
+    task_id = None  # Номер задания в problems.GENERATORS
+    extra_key = ","  # Последняя клавиша экранной клавиатуры для этого задания
+    invalid_message = "Введите число."  # Текст, если ввод не разобран
+    retry_on_invalid = False  # Оставить «Проверить» доступной после неверного формата ввода
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__()
         self.text_scale = text_scale
         self.ui_scale = ui_scale
+        self.problem = None  # Текущее условие (запись из problems)
+        self.prefetcher = None  # Очередь готовых условий (задаёт MathTrainer)
+        self.journal = None  # Журнал попыток (задаёт MathTrainer)
+        self.shown_at = None  # Когда показано текущее условие, для времени на размышление
+        self.stale = True  # Нужно новое условие при следующем показе
+        self.scale_epoch = None  # Эпоха масштаба, с которой задание последний раз перерисовано
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
+        self.apply_styles()
+
+    def next_problem(self):
+        """Следующее условие: из очереди готовых, если она есть, иначе генерируем сразу."""
+        self.shown_at = time.perf_counter()
+        if self.prefetcher is not None:
+            return self.prefetcher.get(self.task_id)
+        return problems.generate(self.task_id)
+
+    def mark_stale(self):
+        """Задание скрыто: дешёвый сброс ввода и результата, а новое условие
+        сгенерируем только когда его снова покажут."""
+        self.stale = True
+        self.result_label.clear()
+        self.result_label.hide()
+        self.clear_inputs()
+
+    def refresh(self):
+        """Вызывается при показе задания: сбрасывает его, если оно устарело."""
+        if self.stale:
+            self.stale = False
+            self.reset_task()
+
+    def active_input(self):
+        """Поле, в которое пишет экранная клавиатура."""
+        return self.input_field
+
+    def clear_inputs(self):
+        self.input_field.clear()
+
+    def append_to_active_input(self, char):
+        field = self.active_input()
+        field.setText(field.text() + char)
 
     def generate_task(self):
         raise NotImplementedError
 
+    def answer_input(self):
+        """Ответ ученика одной строкой — так его разбирает grading."""
+        return self.input_field.text()
+
+    def correct_answer_text(self):
+        return self.problem.answer_text()
+
+    def log_attempt(self, text, verdict):
+        """Записывает попытку в журнал; сама запись на диск идёт в фоновом потоке."""
+        if self.journal is not None:
+            think_time = time.perf_counter() - self.shown_at
+            self.journal.append(self.task_id, self.problem.key, text, verdict, think_time)
+
     def check_answer(self):
-        raise NotImplementedError
+        text = self.answer_input()
+        verdict = grading.grade(self.problem, text)
+        self.log_attempt(text, verdict)
+        if verdict == grading.CORRECT:
+            self.show_result("Правильно!", verdict)
+        elif verdict == grading.WRONG:
+            self.show_result(f"Неправильно. Правильный ответ: {self.correct_answer_text()}", verdict)
+        else:
+            self.show_result(self.invalid_message, verdict)
+        self.result_label.show()
+
+        # Для некоторых заданий неверный формат ввода можно сразу исправить
+        if verdict == grading.INVALID and self.retry_on_invalid:
+            return
+        self.submit_btn.setEnabled(False)
+        self.next_btn.setVisible(True)
 
     def reset_task(self):
         raise NotImplementedError
 
+    def apply_styles(self):
+        """Одна скомпилированная таблица стилей на всё задание."""
+        self.setStyleSheet(styles.compile_stylesheet("task", self.text_scale, self.ui_scale))
+
     def apply_text_scaling(self, scale):
         self.text_scale = scale
-        # Этот метод должен быть переопределен в каждом конкретном задании
-        pass
+        self.apply_styles()
 
     def apply_ui_scaling(self, scale):
         self.ui_scale = scale
-        # Этот метод должен быть переопределен в каждом конкретном задании
-        pass
+        self.apply_styles()
+
+    def apply_scaling(self, text_scale, ui_scale):
+        """Оба масштаба сразу — таблица стилей применяется один раз."""
+        self.text_scale = text_scale
+        self.ui_scale = ui_scale
+        self.apply_styles()
+
+    def show_result(self, text, verdict):
+        """Текст результата; цвет задаётся свойством verdict в таблице стилей."""
+        self.result_label.setText(text)
+        self.result_label.setProperty("verdict", verdict)
+        self.result_label.style().unpolish(self.result_label)
+        self.result_label.style().polish(self.result_label)
 
 class Task1(BaseTask):
+    task_id = 1
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -94,31 +277,16 @@ class Task1(BaseTask):
 
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
-        self.input_field.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                width: {int(300 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """)
+        self.input_field.setObjectName("answer")
+        self.input_field.setProperty("variant", "wide")
 
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
 
         self.submit_btn = QPushButton("Проверить")
@@ -126,40 +294,12 @@ class Task1(BaseTask):
         self.next_btn.setVisible(False)
 
         # Стиль кнопок
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
-
-        self.a = 0
-        self.b = 0
-        self.c = 0
-        self.correct_answer = 0
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
 
         self.scroll_layout.addWidget(self.label)
         self.scroll_layout.addSpacing(int(20 * self.text_scale))
         self.scroll_layout.addWidget(self.input_field)
-        self.setup_virtual_keyboard(self.scroll_layout)
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.result_label)
         self.scroll_layout.addWidget(self.next_btn)
@@ -172,77 +312,17 @@ class Task1(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def setup_virtual_keyboard(self, parent_layout):
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-
-        parent_layout.addLayout(self.keyboard_layout)
-
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        self.a = random.randint(2, 10)
-        self.b = random.randint(20, 90)
-        self.c = random.randint(self.b + 1, 99)  # Ensure B < C
-        self.correct_answer = self.a * (self.b - self.c)
+        self.problem = self.next_problem()
+        p = self.problem
 
-        task_str = f"{self.a} × ({self.b} – {self.c}) ="
+        task_str = f"{p.a} × ({p.b} – {p.c}) ="
         self.label.setText(task_str)
         self.input_field.clear()
         self.result_label.clear()
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = float(self.input_field.text().replace(',', '.'))
-            if user_input == self.correct_answer:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size: {int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.correct_answer}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -251,163 +331,18 @@ class Task1(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        self.input_field.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                width: {int(300 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
 
 class Task2(BaseTask):
+    task_id = 2
+    invalid_message = "Введите числа в оба поля."
+    retry_on_invalid = True
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -416,9 +351,7 @@ class Task2(BaseTask):
         # Текст задания (с дробями)
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Поля для ответа (числитель и знаменатель)
         self.answer_num = QLineEdit()  # числитель
@@ -429,6 +362,7 @@ class Task2(BaseTask):
         self.last_active_field = self.answer_num # Запоминаем, что числитель - активное поле
 
         self.answer_div_line = QLabel("___________")  # дробная черта
+        self.answer_div_line.setObjectName("fraction_line")
         self.answer_div_line.setAlignment(Qt.AlignCenter)
 
         self.answer_den = QLineEdit()  # знаменатель
@@ -439,11 +373,6 @@ class Task2(BaseTask):
         self.answer_num.focusInEvent = self.make_focus_in_handler(self.answer_num)
         self.answer_den.focusInEvent = self.make_focus_in_handler(self.answer_den)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout()
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        self.setup_virtual_keyboard()
-
         # Кнопки
         self.submit_btn = QPushButton("Проверить")
         self.next_btn = QPushButton("Продолжить")
@@ -451,50 +380,17 @@ class Task2(BaseTask):
 
         # Результат
         self.result_label = QLabel("")
+        self.result_label.setObjectName("result_label")
         self.result_label.setAlignment(Qt.AlignCenter)
         self.result_label.hide()
 
         # Стили
-        input_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(80 * self.text_scale)}px;
-                width: {int(200 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-        """
-        self.answer_num.setStyleSheet(input_style)
-        self.answer_den.setStyleSheet(input_style)
-
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        for field in (self.answer_num, self.answer_den):
+            field.setObjectName("answer")
+            field.setProperty("variant", "fraction")
+
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
 
         # Собираем layout
         self.scroll_layout.addWidget(self.label)
@@ -502,7 +398,6 @@ class Task2(BaseTask):
         self.scroll_layout.addWidget(self.answer_num)
         self.scroll_layout.addWidget(self.answer_div_line)
         self.scroll_layout.addWidget(self.answer_den)
-        self.scroll_layout.addLayout(self.keyboard_layout)
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.result_label)
         self.scroll_layout.addWidget(self.next_btn)
@@ -515,6 +410,14 @@ class Task2(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
+    def active_input(self):
+        # Числитель или знаменатель — то поле, что было в фокусе последним
+        return self.last_active_field
+
+    def clear_inputs(self):
+        self.answer_num.clear()
+        self.answer_den.clear()
+
     def make_focus_in_handler(self, field):
         """Возвращает функцию-обработчик для focusInEvent конкретного поля."""
         def handler(event):
@@ -524,66 +427,8 @@ class Task2(BaseTask):
             self.last_active_field = field
         return handler
 
-    def append_to_active_input(self, char):
-        # Используем last_active_field для добавления символа
-        if self.last_active_field:
-            current_text = self.last_active_field.text()
-            self.last_active_field.setText(current_text + char)
-
-    def setup_virtual_keyboard(self):
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_active_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-
     def generate_task(self):
-        # Генерация чисел
-        b = random.randint(2, 8)
-        a = random.randint(b + 1, 9)
-        d = random.randint(2, 8)
-        c = random.randint(d + 1, 9)
-        e = random.randint(5, 25)
-        f = random.randint(5, 9)
-        while f == e:
-            f = random.randint(5, 9)
-
-        self.a, self.b, self.c, self.d, self.e, self.f = a, b, c, d, e, f
-
-        # Формирование строки задания
-        task_html = f"""
-        <div style="text-align: center;">
-        <span style="font-size: {int(60 * self.text_scale)}px;">
-        (<sup>{a}</sup>&frasl;<sub>{b}</sub> &minus; <sup>{c}</sup>&frasl;<sub>{d}</sub>) &divide; <sup>{e}</sup>&frasl;<sub>{f}</sub>
-        </span>
-        </div>
-        """
-        # Вместо прямого setText — вызываем update_label_html
+        self.problem = self.next_problem()
         self.update_label_html()
 
         # Очистка полей
@@ -596,61 +441,29 @@ class Task2(BaseTask):
         self.answer_num.setFocus()
         self.last_active_field = self.answer_num
 
+    def apply_styles(self):
+        super().apply_styles()
+        # Формула нарисована под text_scale, берём картинку для нового масштаба
+        self.update_label_html()
+
     def update_label_html(self):
-        """Пересоздаёт HTML-строку для self.label с учётом текущего text_scale."""
-        if not hasattr(self, 'a'):
+        """Показывает формулу условия в self.label; картинка берётся из кэша по (условию, text_scale)."""
+        if self.problem is None:
             # Если задача ещё не сгенерирована, ничего не делаем
             return
+        self.label.setPixmap(formulas.FORMULA_CACHE.pixmap(self.problem, self.text_scale, self.label.font()))
 
-        # Формируем HTML с новым font-size
-        task_html = f"""
-        <div style="text-align: center;">
-        <span style="font-size: {int(60 * self.text_scale)}px;">
-        (<sup>{self.a}</sup>&frasl;<sub>{self.b}</sub> &minus; <sup>{self.c}</sup>&frasl;<sub>{self.d}</sub>) &divide; <sup>{self.e}</sup>&frasl;<sub>{self.f}</sub>
-        </span>
-        </div>
-        """
-        self.label.setText(task_html)
+    def answer_input(self):
+        return f"{self.answer_num.text().strip()}/{self.answer_den.text().strip()}"
 
     def check_answer(self):
-        try:
-            num = int(self.answer_num.text())
-            den = int(self.answer_den.text())
-
-            # Проверка знаменателя
-            if den == 0:
-                self.result_label.setText("Знаменатель не может быть 0.")
-                self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-                self.result_label.show()
-                return
-
-            user_fraction = Fraction(num, den)
-
-            # Вычисляем правильный ответ
-            frac1 = Fraction(self.a, self.b)
-            frac2 = Fraction(self.c, self.d)
-            div_frac = Fraction(self.e, self.f)
-
-            correct_result = (frac1 - frac2) / div_frac
-
-            if user_fraction == correct_result:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size: {int(60 * self.text_scale)}px;")
-                self.submit_btn.setEnabled(False)
-            else:
-                self.result_label.setText(
-                    f"Неправильно. Правильный ответ: {correct_result.numerator}/{correct_result.denominator}"
-                )
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-                self.submit_btn.setEnabled(False)
-
-        except ValueError:
-            self.result_label.setText("Введите числа в оба поля.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        #self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
+        # Отдельное сообщение для нулевого знаменателя
+        if grading.parse_answer(self.answer_den.text(), "integer") == 0:
+            self.log_attempt(self.answer_input(), grading.INVALID)
+            self.show_result("Знаменатель не может быть 0.", grading.INVALID)
+            self.result_label.show()
+            return
+        super().check_answer()
 
     def reset_task(self):
         self.submit_btn.setEnabled(True)
@@ -661,189 +474,26 @@ class Task2(BaseTask):
         self.answer_den.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        input_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(80 * self.text_scale)}px;
-                width: {int(200 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-        """
-        self.answer_num.setStyleSheet(input_style)
-        self.answer_den.setStyleSheet(input_style)
-        self.answer_div_line.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-        self.update_label_html() 
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
 
 class Task3(BaseTask):
+    task_id = 3
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
 
         # Стиль поля ввода
-        self.input_field.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                width: {int(300 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """)
+        self.input_field.setObjectName("answer")
+        self.input_field.setProperty("variant", "wide")
 
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
 
         self.submit_btn = QPushButton("Проверить")
@@ -851,40 +501,12 @@ class Task3(BaseTask):
         self.next_btn.setVisible(False)
 
         # Стиль кнопок
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
-
-        self.a = 0.0
-        self.b = 0.0
-        self.c = 0.0
-        self.correct_answer = 0.0
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -894,7 +516,6 @@ class Task3(BaseTask):
         self.scroll_layout.addWidget(self.label)
         self.scroll_layout.addSpacing(int(20 * self.text_scale))
         self.scroll_layout.addWidget(self.input_field)
-        self.setup_virtual_keyboard()
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.result_label)
         self.scroll_layout.addWidget(self.next_btn)
@@ -907,80 +528,17 @@ class Task3(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def setup_virtual_keyboard(self):
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-
-        self.scroll_layout.addLayout(self.keyboard_layout)
-
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерация чисел
-        a = round(random.uniform(1.20, 1.99), 2)
-        b = round(random.uniform(0.1, 0.9), 1)
-        c = round(random.uniform(-2.9, -1.2), 1)
+        self.problem = self.next_problem()
+        p = self.problem
 
-        self.a, self.b, self.c = a, b, c
-        self.correct_answer = a - b * c
-
-        task_str = f"{a} – {b} × ({c}) ="
+        task_str = f"{p.a} – {p.b} × ({p.c}) ="
         self.label.setText(task_str)
         self.input_field.clear()
         self.result_label.clear()
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = float(self.input_field.text().replace(',', '.'))
-            if abs(user_input - self.correct_answer) < 1e-6:  # Проверка с допуском
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size: {int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {round(self.correct_answer, 2)}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -989,162 +547,15 @@ class Task3(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        self.input_field.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                width: {int(300 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """)
 
 class Task4(BaseTask):
+    task_id = 4
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -1154,9 +565,7 @@ class Task4(BaseTask):
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setWordWrap(True)  # Разрешить перенос строк
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Добавляем метку в scroll_layout
         self.scroll_layout.addWidget(self.label)
@@ -1164,94 +573,23 @@ class Task4(BaseTask):
         # Поле ввода ответа
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
-        # Стиль поля ввода
-        line_edit_style = f"""
-        QLineEdit {{
-            background-color: white;
-            border: 2px solid #ccc;
-            border-radius: 8px;
-            padding: 8px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            width: {int(300 * self.text_scale)}px;
-            height: {int(60 * self.text_scale)}px;
-        }}
-        QLineEdit:focus {{
-            border: 2px solid #007acc;
-        }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
+        self.input_field.setObjectName("answer")
+        self.input_field.setProperty("variant", "wide")
         self.scroll_layout.addWidget(self.input_field)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: {int(60 * self.text_scale)}px;
-                    color: black;
-                    min-width: {int(60 * self.ui_scale)}px;
-                    min-height: {int(60 * self.ui_scale)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #f5f5f5;
-                }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-        self.scroll_layout.addLayout(self.keyboard_layout)
-
         # Кнопки
         self.submit_btn = QPushButton("Проверить")
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
-        button_style = f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        QPushButton:pressed {{
-            background-color: #d0d0d0;
-        }}
-        QPushButton:disabled {{
-            background-color: #cccccc;
-            color: #888888;
-        }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.next_btn)
 
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
         self.scroll_layout.addWidget(self.result_label)
 
@@ -1260,52 +598,20 @@ class Task4(BaseTask):
         # Добавляем scroll area в основной layout (от BaseTask)
         self.layout.addWidget(self.scroll_area)
 
-        self.a = 0
-        self.b = 0
-        self.c = 0
-        self.correct_answer = 0
-
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерация чисел
-        a = random.randint(-9, -2)
-        b = random.randint(2, 9)
-        c = random.randint(-19, -10)
+        self.problem = self.next_problem()
+        p = self.problem
 
-        self.a, self.b, self.c = a, b, c
-        # Вычисляем: a * |c + b|
-        self.correct_answer = a * abs(c + b)
-
-        task_str = f"Найдите значение выражения {a} × |y + {b}| при y = {c}"
+        task_str = f"Найдите значение выражения {p.a} × |y + {p.b}| при y = {p.c}"
         self.label.setText(task_str)
         self.input_field.clear()
         self.result_label.clear()
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = float(self.input_field.text().replace(',', '.'))
-            if user_input == self.correct_answer:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size:{int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.correct_answer}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -1314,135 +620,15 @@ class Task4(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        line_edit_style = f"""
-        QLineEdit {{
-            background-color: white;
-            border: 2px solid #ccc;
-            border-radius: 8px;
-            padding: 8px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            width: {int(300 * self.text_scale)}px;
-            height: {int(60 * self.text_scale)}px;
-        }}
-        QLineEdit:focus {{
-            border: 2px solid #007acc;
-        }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: {int(60 * self.text_scale)}px;
-                    color: black;
-                    min-width: {int(60 * self.ui_scale)}px;
-                    min-height: {int(60 * self.ui_scale)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #f5f5f5;
-                }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: {int(60 * self.text_scale)}px;
-                    color: black;
-                    min-width: {int(60 * self.ui_scale)}px;
-                    min-height: {int(60 * self.ui_scale)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #f5f5f5;
-                }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
 
 class Task5(BaseTask):
+    task_id = 5
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -1452,9 +638,7 @@ class Task5(BaseTask):
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setWordWrap(True)  # Разрешить перенос строк
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Добавляем метку в scroll_layout
         self.scroll_layout.addWidget(self.label)
@@ -1462,94 +646,23 @@ class Task5(BaseTask):
         # Поле ввода ответа
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
-        # Стиль поля ввода
-        line_edit_style = f"""
-        QLineEdit {{
-            background-color: white;
-            border: 2px solid #ccc;
-            border-radius: 8px;
-            padding: 8px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            width: {int(300 * self.text_scale)}px;
-            height: {int(60 * self.text_scale)}px;
-        }}
-        QLineEdit:focus {{
-            border: 2px solid #007acc;
-        }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
+        self.input_field.setObjectName("answer")
+        self.input_field.setProperty("variant", "wide")
         self.scroll_layout.addWidget(self.input_field)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: {int(60 * self.text_scale)}px;
-                    color: black;
-                    min-width: {int(60 * self.ui_scale)}px;
-                    min-height: {int(60 * self.ui_scale)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #f5f5f5;
-                }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-        self.scroll_layout.addLayout(self.keyboard_layout)
-
         # Кнопки
         self.submit_btn = QPushButton("Проверить")
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
-        button_style = f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        QPushButton:pressed {{
-            background-color: #d0d0d0;
-        }}
-        QPushButton:disabled {{
-            background-color: #cccccc;
-            color: #888888;
-        }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.next_btn)
 
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
         self.scroll_layout.addWidget(self.result_label)
 
@@ -1558,71 +671,20 @@ class Task5(BaseTask):
         # Добавляем scroll area в основной layout (от BaseTask)
         self.layout.addWidget(self.scroll_area)
 
-        self.a = 0
-        self.b = 0
-        self.c = 0.0
-        self.d = 0.0
-        self.correct_answer = 0.0
-
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерация чисел
-        a = random.randint(10, 25)  # Чтобы гарантировать, что B < A
-        b = random.randint(8, a - 1)
-        c = round(random.uniform(1.1, 9.9), 1)
-        d = round(random.uniform(1.1, 9.9), 1)
-
-        self.a, self.b, self.c, self.d = a, b, c, d
-
-        # Решаем: (A - B)x = C + D => x = (C + D) / (A - B)
-        denominator = a - b
-        numerator = c + d
-        x = numerator / denominator
-
-        # Проверяем, что результат — конечная дробь с 1 знаком после запятой
-        # Если нет — генерируем заново (до тех пор, пока не получим подходящий x)
-        while True:
-            x = numerator / denominator
-            rounded_x = round(x, 1)
-            if abs(x - rounded_x) < 1e-9:  # Проверяем, что x == rounded_x (т.е. не 1.234...)
-                self.correct_answer = rounded_x
-                break
-            # Перегенерируем C и D, чтобы получить подходящий x
-            c = round(random.uniform(1.1, 9.9), 1)
-            d = round(random.uniform(1.1, 9.9), 1)
-            numerator = c + d
-            self.c, self.d = c, d
-
-        task_str = f"Найдите неизвестное значение x из равенства: {a}x - {b}x = {c} + {d}"
+        self.problem = self.next_problem()
+        p = self.problem
+
+        task_str = f"Найдите неизвестное значение x из равенства: {p.a}x - {p.b}x = {p.c} + {p.d}"
         self.label.setText(task_str)
         self.input_field.clear()
         self.result_label.clear()
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = float(self.input_field.text().replace(',', '.'))
-            if abs(user_input - self.correct_answer) < 1e-9:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size:{int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.correct_answer:.1f}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -1631,136 +693,16 @@ class Task5(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        line_edit_style = f"""
-        QLineEdit {{
-            background-color: white;
-            border: 2px solid #ccc;
-            border-radius: 8px;
-            padding: 8px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            width: {int(300 * self.text_scale)}px;
-            height: {int(60 * self.text_scale)}px;
-        }}
-        QLineEdit:focus {{
-            border: 2px solid #007acc;
-        }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: {int(60 * self.text_scale)}px;
-                    color: black;
-                    min-width: {int(60 * self.ui_scale)}px;
-                    min-height: {int(60 * self.ui_scale)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #f5f5f5;
-                }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: {int(60 * self.text_scale)}px;
-                    color: black;
-                    min-width: {int(60 * self.ui_scale)}px;
-                    min-height: {int(60 * self.ui_scale)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #f5f5f5;
-                }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
 
 class Task6(BaseTask):
+    task_id = 6
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -1770,9 +712,7 @@ class Task6(BaseTask):
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setWordWrap(True)  # Разрешить перенос строк
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Добавляем метку в scroll_layout
         self.scroll_layout.addWidget(self.label)
@@ -1781,32 +721,13 @@ class Task6(BaseTask):
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
 
-        # Стиль поля ввода
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
+        self.input_field.setObjectName("answer")
         self.scroll_layout.addWidget(self.input_field)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        self.setup_virtual_keyboard()
-
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
         self.scroll_layout.addWidget(self.result_label)
 
@@ -1815,30 +736,8 @@ class Task6(BaseTask):
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
 
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.next_btn)
 
@@ -1850,98 +749,16 @@ class Task6(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def setup_virtual_keyboard(self):
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-        self.scroll_layout.addLayout(self.keyboard_layout) # Добавляем лэйаут клавиатуры в scroll_layout
-
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерация чисел
-        a = random.randint(10, 99) * 10  # Трёхзначное, кратное 10
-        b = random.randint(2, 8)         # Время в первый день
-        c = random.choice([5, 10, 15, 20, 25])  # Кратное 5
-
-        self.a, self.b, self.c = a, b, c
-
-        # Скорость в первый день
-        speed1 = a / b
-
-        # Скорость на обратном пути
-        speed2 = speed1 - c
-
-        # Проверяем, что t2 < 10, t2 != 0, и имеет формат X.5 (одна цифра после запятой, Y = 5)
-        while True:
-            if speed2 == 0:
-                # Перегенерация, чтобы избежать деления на 0
-                a = random.randint(10, 99) * 10
-                b = random.randint(2, 8)
-                c = random.choice([5, 10, 15, 20, 25])
-                self.a, self.b, self.c = a, b, c
-                speed1 = a / b
-                speed2 = speed1 - c
-                continue
-
-            t2 = a / speed2
-            if t2 >= 10:
-                # Перегенерация
-                a = random.randint(10, 99) * 10
-                b = random.randint(2, 8)
-                speed1 = a / b
-                speed2 = speed1 - c
-                continue
-
-            rounded_t2 = round(t2, 1)
-            if abs(t2 - rounded_t2) < 1e-9:
-                decimal_part = (rounded_t2 * 10) % 10
-                if decimal_part == 5:
-                    self.correct_answer = rounded_t2
-                    break
-
-            # Иначе снова генерируем
-            a = random.randint(10, 99) * 10
-            b = random.randint(2, 8)
-            c = random.choice([5, 10, 15, 20, 25])
-            self.a, self.b, self.c = a, b, c
-            speed1 = a / b
-            speed2 = speed1 - c
+        self.problem = self.next_problem()
+        p = self.problem
 
         # Формируем текст задачи
         task_text = (
-            f"Автомобиль проехал с постоянной скоростью {a} км "
-            f"от города А до города Б за {b} ч. На следующий день "
+            f"Автомобиль проехал с постоянной скоростью {p.a} км "
+            f"от города А до города Б за {p.b} ч. На следующий день "
             f"автомобиль проехал тот же путь обратно со скоростью "
-            f"на {c} км/ч меньше, чем в первый день. "
+            f"на {p.c} км/ч меньше, чем в первый день. "
             f"Сколько часов потребовалось автомобилю на обратный путь?"
         )
 
@@ -1951,23 +768,6 @@ class Task6(BaseTask):
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = float(self.input_field.text().replace(',', '.'))
-            if abs(user_input - self.correct_answer) < 1e-9:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size:{int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.correct_answer:.1f}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -1976,134 +776,19 @@ class Task6(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
 
 class Task7(BaseTask):
+    task_id = 7
+    extra_key = "/"  # Ответ — обыкновенная дробь
+    invalid_message = "Введите дробь в формате -1/N"
+    retry_on_invalid = True
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -2112,105 +797,33 @@ class Task7(BaseTask):
         # Заголовок
         self.label = QLabel("")
         self.label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Отображение примера в виде дробей
         self.task_display = QLabel("")
         self.task_display.setAlignment(Qt.AlignCenter)
-        self.task_display.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.task_display.setObjectName("task_display")
 
         # Поле ввода ответа в формате -1/N
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
         self.input_field.setPlaceholderText("Несократимая обыкновенная дробь")
 
-        # Стиль поля ввода
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(40 * self.text_scale)}px;
-                color: black;
-                width: {int(200 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-
-        # Виртуальная клавиатура (заменяем "," на "/")
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', '/']  # Заменяем запятую на "/"
-        ]
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
+        self.input_field.setObjectName("answer")
+        self.input_field.setProperty("variant", "small_font")
 
         # Кнопки
         self.submit_btn = QPushButton("Проверить")
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
 
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
 
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
 
         # Компоновка в scroll_layout
@@ -2218,7 +831,6 @@ class Task7(BaseTask):
         self.scroll_layout.addWidget(self.task_display)
         self.scroll_layout.addSpacing(int(20 * self.text_scale))
         self.scroll_layout.addWidget(self.input_field)
-        self.scroll_layout.addLayout(self.keyboard_layout)
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.result_label)
         self.scroll_layout.addWidget(self.next_btn)
@@ -2231,104 +843,8 @@ class Task7(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерация чисел
-        # б: дробь, числитель < знаменателя, знаменатель от 3 до 8
-        den_b = random.randint(3, 8)
-        num_b = random.randint(1, den_b - 1)
-        frac_b = Fraction(num_b, den_b)
-
-        # в: дробь, числитель может быть >= знаменателя, но не кратен ему
-        den_v = random.randint(4, 12)
-        num_v = random.randint(1, den_v + 2)
-        while num_v % den_v == 0:
-            num_v = random.randint(1, den_v + 2)
-        frac_v = Fraction(num_v, den_v)
-
-        # г: аналогично в, но НЕ совпадает с в
-        while True:
-            den_g = random.randint(4, 12)
-            num_g = random.randint(1, den_g + 2)
-            while num_g % den_g == 0:
-                num_g = random.randint(1, den_g + 2)
-            frac_g = Fraction(num_g, den_g)
-            if frac_g != frac_v:
-                break  # Успешно сгенерирована дробь, отличающаяся от frac_v
-
-        # д: числитель от 3*den до 13*den, знаменатель от 3 до 7
-        den_d = random.randint(3, 7)
-        num_d = random.randint(3 * den_d, 13 * den_d)
-        while num_d % den_d == 0:
-            num_d = random.randint(3 * den_d, 13 * den_d)
-        frac_d = Fraction(num_d, den_d)
-
-        # е: целое число от 2 до 9
-        e = random.randint(2, 9)
-
-        # Вычисляем: (1 + frac_b) * (frac_v + frac_g) - frac_d / e
-        mixed_num = 1 + frac_b
-        sum_fractions = frac_v + frac_g
-        div_frac = frac_d / e
-
-        result = mixed_num * sum_fractions - div_frac
-
-        # Проверяем, что результат — отрицательная дробь вида -1/N
-        while not (result < 0 and result.numerator == -1 and 2 <= result.denominator <= 9):
-            # Перегенерация
-            den_b = random.randint(3, 8)
-            num_b = random.randint(1, den_b - 1)
-            frac_b = Fraction(num_b, den_b)
-
-            den_v = random.randint(4, 12)
-            num_v = random.randint(1, den_v + 2)
-            while num_v % den_v == 0:
-                num_v = random.randint(1, den_v + 2)
-            frac_v = Fraction(num_v, den_v)
-
-            # г: аналогично в, но НЕ совпадает с в
-            while True:
-                den_g = random.randint(4, 12)
-                num_g = random.randint(1, den_g + 2)
-                while num_g % den_g == 0:
-                    num_g = random.randint(1, den_g + 2)
-                frac_g = Fraction(num_g, den_g)
-                if frac_g != frac_v:
-                    break
-
-            den_d = random.randint(3, 7)
-            num_d = random.randint(3 * den_d, 13 * den_d)
-            while num_d % den_d == 0:
-                num_d = random.randint(3 * den_d, 13 * den_d)
-            frac_d = Fraction(num_d, den_d)
-
-            e = random.randint(2, 9)
-
-            mixed_num = 1 + frac_b
-            sum_fractions = frac_v + frac_g
-            div_frac = frac_d / e
-            result = mixed_num * sum_fractions - div_frac
-
-        self.frac_b = frac_b
-        self.frac_v = frac_v
-        self.frac_g = frac_g
-        self.frac_d = frac_d
-        self.e = e
-        self.correct_answer = result
-
-        # Формируем HTML-строку для отображения
-        task_html = f"""
-        <div style="text-align: center;">
-        <span style="font-size: {int(60 * self.text_scale)}px;">
-        1<sup>{frac_b.numerator}</sup>&frasl;<sub>{frac_b.denominator}</sub> &times; (<sup>{frac_v.numerator}</sup>&frasl;<sub>{frac_v.denominator}</sub> + <sup>{frac_g.numerator}</sup>&frasl;<sub>{frac_g.denominator}</sub>) &minus; <sup>{frac_d.numerator}</sup>&frasl;<sub>{frac_d.denominator}</sub> &divide; {e}
-        </span>
-        </div>
-        """
-        self.label.setText(task_html)
-
+        self.problem = self.next_problem()
         self.update_label_html()  # ← Используем новый метод
 
 
@@ -2339,34 +855,6 @@ class Task7(BaseTask):
         self.next_btn.setVisible(False)
 
 
-    def check_answer(self):
-        try:
-            user_input_str = self.input_field.text().strip()
-            if '/' not in user_input_str:
-                raise ValueError("Введите дробь в формате -1/N")
-            parts = user_input_str.split('/')
-            if len(parts) != 2:
-                raise ValueError("Введите дробь в формате -1/N")
-            num = int(parts[0])
-            den = int(parts[1])
-            user_frac = Fraction(num, den)
-        except ValueError:
-            self.result_label.setText("Введите дробь в формате -1/N")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-            self.result_label.show()
-            return
-
-        if user_frac == self.correct_answer:
-            self.result_label.setText("Правильно!")
-            self.result_label.setStyleSheet(f"color: green; font-size: {int(60 * self.text_scale)}px;")
-        else:
-            self.result_label.setText(f"Неправильно. Правильный ответ: {self.correct_answer}")
-            self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -2375,153 +863,29 @@ class Task7(BaseTask):
         self.input_field.clear()
         self.generate_task()
     
+    def apply_styles(self):
+        super().apply_styles()
+        # Формула нарисована под text_scale, берём картинку для нового масштаба
+        self.update_label_html()
+
     def update_label_html(self):
-        """Пересоздаёт HTML-строку для self.label с учётом текущего text_scale."""
-        if not hasattr(self, 'frac_b'):
+        """Показывает формулу условия в self.label; картинка берётся из кэша по (условию, text_scale)."""
+        if self.problem is None:
             # Если задача ещё не сгенерирована, ничего не делаем
             return
+        self.label.setPixmap(formulas.FORMULA_CACHE.pixmap(self.problem, self.text_scale, self.label.font()))
 
-        task_html = f"""
-        <div style="text-align: center;">
-        <span style="font-size: {int(60 * self.text_scale)}px;">
-        1<sup>{self.frac_b.numerator}</sup>&frasl;<sub>{self.frac_b.denominator}</sub> &times; (<sup>{self.frac_v.numerator}</sup>&frasl;<sub>{self.frac_v.denominator}</sub> + <sup>{self.frac_g.numerator}</sup>&frasl;<sub>{self.frac_g.denominator}</sub>) &minus; <sup>{self.frac_d.numerator}</sup>&frasl;<sub>{self.frac_d.denominator}</sub> &divide; {self.e}
-        </span>
-        </div>
-        """
-        self.label.setText(task_html)
-
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        self.task_display.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(40 * self.text_scale)}px;
-                color: black;
-                width: {int(200 * self.text_scale)}px;
-                height: {int(60 * self.text_scale)}px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-        self.update_label_html()
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
 
 class Task8(BaseTask):
+    task_id = 8
+    invalid_message = "Введите целое число."
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -2531,9 +895,7 @@ class Task8(BaseTask):
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setWordWrap(True)  # Разрешить перенос строк
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Добавляем метку в scroll_layout
         self.scroll_layout.addWidget(self.label)
@@ -2542,32 +904,13 @@ class Task8(BaseTask):
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
 
-        # Стиль поля ввода
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
+        self.input_field.setObjectName("answer")
         self.scroll_layout.addWidget(self.input_field)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        self.setup_virtual_keyboard()
-
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
         self.scroll_layout.addWidget(self.result_label)
 
@@ -2576,30 +919,8 @@ class Task8(BaseTask):
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
 
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.next_btn)
 
@@ -2611,68 +932,16 @@ class Task8(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def setup_virtual_keyboard(self):
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-        self.scroll_layout.addLayout(self.keyboard_layout) # Добавляем лэйаут клавиатуры в scroll_layout
-
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерация чисел
-        b = random.randint(2, 6)  # Отношение этажей к квартирам на этаже
-        y = random.randint(6, 25)  # Число этажей
-
-        # Квартир на этаже = y / b
-        if y % b != 0:
-            # Перегенерировать y, пока оно не будет кратно b
-            while y % b != 0:
-                y = random.randint(6, 25)
-
-        x = y // b  # Квартир на этаже
-        a = random.randint(100, 999)  # Общее число квартир
-
-        # Проверяем, что a делится на x
-        while a % x != 0:
-            a = random.randint(100, 999)
-
-        self.a, self.b, self.y = a, b, y
+        self.problem = self.next_problem()
+        p = self.problem
 
         # Формируем текст задачи
         task_text = (
-            f"В многоквартирном доме {a} квартир. Известно, что во всех подъездах дома "
+            f"В многоквартирном доме {p.a} квартир. Известно, что во всех подъездах дома "
             f"одинаковое число этажей и на любом этаже каждого подъезда одинаковое число "
             f"квартир (больше одной). Сколько этажей в этом доме, если число квартир "
-            f"на каждом этаже в подъезде в {b} раза меньше числа этажей в доме?"
+            f"на каждом этаже в подъезде в {p.b} раза меньше числа этажей в доме?"
         )
 
         self.label.setText(task_text)
@@ -2681,23 +950,6 @@ class Task8(BaseTask):
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = int(self.input_field.text().strip())
-            if user_input == self.y:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size:{int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.y}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите целое число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -2706,134 +958,17 @@ class Task8(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
 
 class Task9(BaseTask):
+    task_id = 9
+    invalid_message = "Введите целое число."
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -2843,9 +978,7 @@ class Task9(BaseTask):
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setWordWrap(True)  # Разрешить перенос строк
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Добавляем метку в scroll_layout
         self.scroll_layout.addWidget(self.label)
@@ -2854,32 +987,13 @@ class Task9(BaseTask):
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
 
-        # Стиль поля ввода
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
+        self.input_field.setObjectName("answer")
         self.scroll_layout.addWidget(self.input_field)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        self.setup_virtual_keyboard()
-
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
         self.scroll_layout.addWidget(self.result_label)
 
@@ -2888,30 +1002,8 @@ class Task9(BaseTask):
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
 
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.next_btn)
 
@@ -2923,72 +1015,14 @@ class Task9(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def setup_virtual_keyboard(self):
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-        self.scroll_layout.addLayout(self.keyboard_layout) # Добавляем лэйаут клавиатуры в scroll_layout
-
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Предварительно сгенерировать все валидные комбинации
-        valid_combinations = []
-
-        for a in range(20, 31):
-            for b in range(2, 10):
-                for v in range(20, 31):
-                    if (a * v) % 100 != 0:
-                        continue
-                    class_a = a
-                    class_b = a - b
-                    class_c = a - (a * v // 100)
-                    total = class_a + class_b + class_c
-
-                    if 50 <= total <= 90:
-                        valid_combinations.append((a, b, v, total))
-
-        if not valid_combinations:
-            # Если нет валидных комбинаций, бросить исключение
-            raise RuntimeError("No valid combinations found for Task9 parameters.")
-
-        # Выбираем случайную комбинацию
-        a, b, v, total = random.choice(valid_combinations)
-
-        self.a, self.b, self.v, self.total = a, b, v, total
+        self.problem = self.next_problem()
+        p = self.problem
 
         # Формируем текст задачи
         task_text = (
-            f"В 6 \"А\" классе учится {a} человек, что на {b} человека больше, "
-            f"чем в 6 \"В\" классе. А в 6 \"Б\" классе учеников на {v}% меньше, "
+            f"В 6 \"А\" классе учится {p.a} человек, что на {p.b} человека больше, "
+            f"чем в 6 \"В\" классе. А в 6 \"Б\" классе учеников на {p.v}% меньше, "
             f"чем в 6 \"А\". Сколько всего учеников в этих трёх классах?"
         )
 
@@ -2998,23 +1032,6 @@ class Task9(BaseTask):
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = int(self.input_field.text().strip())
-            if user_input == self.total:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size:{int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.total}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите целое число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -3023,134 +1040,17 @@ class Task9(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
-
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
 
 class Task10(BaseTask):
+    task_id = 10
+    invalid_message = "Введите целое число."
+
     def __init__(self, text_scale=1.0, ui_scale=1.0):
         super().__init__(text_scale, ui_scale)
 
         # Создаем ScrollArea
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("border: none;")
         # Виджет внутри ScrollArea
         self.scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_content)
@@ -3160,9 +1060,7 @@ class Task10(BaseTask):
         self.label = QLabel("Нажмите 'Новый пример', чтобы начать.")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setWordWrap(True)  # Разрешить перенос строк
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
+        self.label.setObjectName("task_label")
 
         # Добавляем метку в scroll_layout
         self.scroll_layout.addWidget(self.label)
@@ -3171,32 +1069,13 @@ class Task10(BaseTask):
         self.input_field = QLineEdit()
         self.input_field.setAlignment(Qt.AlignCenter)
 
-        # Стиль поля ввода
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
+        self.input_field.setObjectName("answer")
         self.scroll_layout.addWidget(self.input_field)
 
-        # Виртуальная клавиатура
-        self.keyboard_layout = QGridLayout() # Сделаем его атрибутом класса
-        self.keyboard_buttons = [] # Список кнопок клавиатуры
-        self.setup_virtual_keyboard()
-
         # Результат
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
+        self.result_label.setObjectName("result_label")
         self.result_label.hide()
         self.scroll_layout.addWidget(self.result_label)
 
@@ -3205,30 +1084,8 @@ class Task10(BaseTask):
         self.next_btn = QPushButton("Продолжить")
         self.next_btn.setVisible(False)
 
-        button_style = f"""
-            QPushButton {{
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(100 * self.ui_scale)}px;
-                min-height: {int(50 * self.ui_scale)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #e0e0e0;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #888888;
-            }}
-        """
-        self.submit_btn.setStyleSheet(button_style)
-        self.next_btn.setStyleSheet(button_style)
+        self.submit_btn.setObjectName("action")
+        self.next_btn.setObjectName("action")
         self.scroll_layout.addWidget(self.submit_btn)
         self.scroll_layout.addWidget(self.next_btn)
 
@@ -3240,70 +1097,15 @@ class Task10(BaseTask):
         self.submit_btn.clicked.connect(self.check_answer)
         self.next_btn.clicked.connect(self.reset_task)
 
-    def setup_virtual_keyboard(self):
-        buttons = [
-            ['1', '2', '3'],
-            ['4', '5', '6'],
-            ['7', '8', '9'],
-            ['0', '-', ',']
-        ]
-        for i, row in enumerate(buttons):
-            button_row = []
-            for j, char in enumerate(row):
-                btn = QPushButton(char)
-                btn.clicked.connect(lambda _, s=char: self.append_to_input(s))
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-                self.keyboard_layout.addWidget(btn, i, j)
-                button_row.append(btn)
-            self.keyboard_buttons.append(button_row)
-        self.scroll_layout.addLayout(self.keyboard_layout) # Добавляем лэйаут клавиатуры в scroll_layout
-
-    def append_to_input(self, char):
-        current_text = self.input_field.text()
-        self.input_field.setText(current_text + char)
-
     def generate_task(self):
-        # Генерируем A и B
-        a = random.randint(2, 6)
-        b = random.randint(1, 9) * 10  # Кратное 10: 10, 20, ..., 90
-
-        # Уравнение: (A * d) * 10 - d * 10 = B
-        # => (A - 1) * d * 10 = B
-        # => d = B / ((A - 1) * 10)
-
-        denominator = (a - 1) * 10
-        if b % denominator != 0:
-            # Перегенерируем B, пока не найдём подходящее
-            while b % denominator != 0:
-                b = random.randint(1, 9) * 10
-
-        d = b // denominator
-        x = d * 10
-
-        # Проверим, что x — двузначное и оканчивается на 0
-        assert 10 <= x <= 90 and x % 10 == 0
-
-        self.a, self.b, self.x = a, b, x
+        self.problem = self.next_problem()
+        p = self.problem
 
         # Формируем текст задачи
         task_text = (
             f"Задумали двузначное число, которое кратно 10. "
-            f"Если цифру десятков увеличить в {a} раза, "
-            f"то число увеличится на {b}. Какое число было задумано?"
+            f"Если цифру десятков увеличить в {p.a} раза, "
+            f"то число увеличится на {p.b}. Какое число было задумано?"
         )
 
         self.label.setText(task_text)
@@ -3312,23 +1114,6 @@ class Task10(BaseTask):
         self.result_label.hide()
         self.next_btn.setVisible(False)
 
-    def check_answer(self):
-        try:
-            user_input = int(self.input_field.text().strip())
-            if user_input == self.x:
-                self.result_label.setText("Правильно!")
-                self.result_label.setStyleSheet(f"color: green; font-size:{int(60 * self.text_scale)}px;")
-            else:
-                self.result_label.setText(f"Неправильно. Правильный ответ: {self.x}")
-                self.result_label.setStyleSheet(f"color: red; font-size: {int(60 * self.text_scale)}px;")
-        except ValueError:
-            self.result_label.setText("Введите целое число.")
-            self.result_label.setStyleSheet(f"color: orange; font-size: {int(60 * self.text_scale)}px;")
-
-        self.result_label.show()
-        self.submit_btn.setEnabled(False)
-        self.next_btn.setVisible(True)
-
     def reset_task(self):
         self.submit_btn.setEnabled(True)
         self.next_btn.setVisible(False)
@@ -3337,134 +1122,46 @@ class Task10(BaseTask):
         self.input_field.clear()
         self.generate_task()
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        font = QFont()
-        font.setPointSize(int(60 * self.text_scale))
-        self.label.setFont(font)
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: white;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #007acc;
-            }}
-        """
-        self.input_field.setStyleSheet(line_edit_style)
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setFont(QFont("Arial", int(60 * self.text_scale)))
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.result_label.setStyleSheet(f"font-size: {int(60 * self.text_scale)}px;")
 
-    def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        for row in self.keyboard_buttons:
-            for btn in row:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #ffffff;
-                        border: 1px solid #ddd;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: {int(60 * self.text_scale)}px;
-                        color: black;
-                        min-width: {int(60 * self.ui_scale)}px;
-                        min-height: {int(60 * self.ui_scale)}px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                """)
-        self.submit_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
-        self.next_btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """)
+# Реестр заданий: номер -> фабрика виджета (вызывается с text_scale и ui_scale)
+TASK_FACTORIES = {
+    1: Task1,
+    2: Task2,
+    3: Task3,
+    4: Task4,
+    5: Task5,
+    6: Task6,
+    7: Task7,
+    8: Task8,
+    9: Task9,
+    10: Task10,
+}
+
+# Через сколько миллисекунд после запуска начинать прогрев остальных заданий
+WARM_UP_DELAY_MS = 500
+# Через сколько миллисекунд после запуска в быстром режиме запускать фоновую генерацию
+FAST_START_DELAY_MS = 500
+
+
+def default_journal_path():
+    """Журнал попыток по умолчанию — в папке данных пользователя."""
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation)
+    return os.path.join(base, "MathTrainer", "attempts.journal")
 
 
 class MathTrainer(QMainWindow):
-    def __init__(self):
+    def __init__(self, fast_start=False):
         super().__init__()
         self.settings = QSettings("MathTrainer", "Settings")
+        # Быстрый запуск: всё, что не нужно первому заданию, откладываем до показа окна
+        self.fast_start = fast_start or self.settings.value("fast_start", False, type=bool)
+        self.build_times = {}  # Сколько секунд строился виджет каждого задания
         # Загружаем сохраненные значения или используем по умолчанию
         self.text_scale = self.settings.value("text_scale", 1.0, type=float)
         self.ui_scale = self.settings.value("ui_scale", 1.0, type=float)
+        # Эпоха масштаба растёт при каждом его изменении; счётчик применённых и пропущенных перерисовок
+        self.scale_epoch = 0
+        self.restyles = Counter()
 
         self.setWindowTitle("Математический тренажёр 6 класс")
         self.setGeometry(200, 200, 600, 500)
@@ -3506,86 +1203,98 @@ class MathTrainer(QMainWindow):
         layout = QVBoxLayout()
 
         # Панель с кнопками заданий и кнопкой настроек
-        top_bar = QHBoxLayout()
+        self.top_bar_widget = QWidget()
+        top_bar = QHBoxLayout(self.top_bar_widget)
         top_bar.setAlignment(Qt.AlignCenter)
 
         # Кнопка настроек
         self.settings_btn = QPushButton("Настройки")
+        self.settings_btn.setObjectName("settings")
         self.settings_btn.clicked.connect(self.open_settings)
-        # Применяем масштабирование к кнопке настроек
-        settings_btn_style = f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px; /* Шрифт */
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px; /* Размер */
-            min-height: {int(50 * self.ui_scale)}px; /* Размер */
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """
-        self.settings_btn.setStyleSheet(settings_btn_style)
         top_bar.addWidget(self.settings_btn)
 
         # Кнопки выбора задания
         self.task_buttons = []
-        for i in range(1, 11):
+        for i in TASK_FACTORIES:
             btn = QPushButton(str(i))
+            btn.setObjectName("task_button")
             btn.setCheckable(True)
             btn.clicked.connect(lambda checked, n=i: self.select_task(n))
-            # Применяем масштабирование к кнопке задания
-            task_btn_style = f"""
-            QPushButton {{
-                background-color: #ffffff;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 6px 22px;
-                font-size: {int(60 * self.text_scale)}px; /* Шрифт */
-                color: black;
-                min-width: {int(50 * self.ui_scale)}px; /* Размер */
-                min-height: {int(40 * self.ui_scale)}px; /* Размер */
-            }}
-            QPushButton:checked {{
-                background-color: #007acc;
-                color: white;
-                border: 1px solid #005fa3;
-            }}
-            """
-            btn.setStyleSheet(task_btn_style)
             top_bar.addWidget(btn)
             self.task_buttons.append(btn)
+        layout.addWidget(self.top_bar_widget)
 
-        layout.addLayout(top_bar)
+        # Контент для заданий: все созданные задания живут в стеке,
+        # переключение меняет только текущую страницу
+        self.task_stack = QStackedWidget()
+        layout.addWidget(self.task_stack)
 
-        # Контент для заданий
-        self.content_area = QVBoxLayout()
-        self.content_area.setAlignment(Qt.AlignCenter)
-        layout.addLayout(self.content_area)
+        # Одна экранная клавиатура на все задания; пишет в поле текущего задания
+        self.keyboard = VirtualKeyboard()
+        self.keyboard.key_pressed.connect(self.on_key_pressed)
+        layout.addWidget(self.keyboard)
 
         main_widget.setLayout(layout)
+        self.apply_window_styles()
 
-        # Создаём экземпляры заданий с начальным масштабом
-        self.tasks = [None] * 10
-        self.tasks[0] = Task1(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[1] = Task2(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[2] = Task3(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[3] = Task4(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[4] = Task5(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[5] = Task6(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[6] = Task7(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[7] = Task8(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[8] = Task9(text_scale=self.text_scale, ui_scale=self.ui_scale)
-        self.tasks[9] = Task10(text_scale=self.text_scale, ui_scale=self.ui_scale)
+        # Фоновая очередь готовых условий для каждого задания
+        self.prefetcher = ProblemPrefetcher(
+            TASK_FACTORIES, depth=self.settings.value("prefetch_depth", DEFAULT_DEPTH, type=int),
+            start=not self.fast_start,
+        )
+        if self.fast_start:
+            # Фоновый поток не отнимает время у первой отрисовки
+            QTimer.singleShot(FAST_START_DELAY_MS, self.prefetcher.start)
+
+        # Журнал попыток; пустой путь в настройке journal_path отключает его
+        journal_path = self.settings.value("journal_path", default_journal_path(), type=str)
+        self.journal = journal.AttemptJournal(journal_path) if journal_path else None
 
+        # Виджеты заданий создаются при первом выборе (TASK_FACTORIES)
+        self.tasks = {}
         self.current_task_widget = None
         self.select_task(1)
 
+        # Необязательный прогрев: остальные задания строятся по одному, когда окно простаивает
+        self.warm_up_timer = QTimer(self)
+        self.warm_up_timer.setInterval(0)
+        self.warm_up_timer.timeout.connect(self.warm_up_next)
+        if self.settings.value("warm_up_tasks", False, type=bool):
+            QTimer.singleShot(WARM_UP_DELAY_MS, self.warm_up_timer.start)
+
+    def task_widget(self, index):
+        """Виджет задания index; создаётся при первом обращении."""
+        task = self.tasks.get(index)
+        if task is None:
+            started = time.perf_counter()
+            task = TASK_FACTORIES[index](text_scale=self.text_scale, ui_scale=self.ui_scale)
+            self.build_times[index] = time.perf_counter() - started
+            task.prefetcher = self.prefetcher
+            task.journal = self.journal
+            task.scale_epoch = self.scale_epoch  # Создано уже с текущим масштабом
+            self.tasks[index] = task
+            self.task_stack.addWidget(task)
+        return task
+
+    def warm_up_next(self):
+        # Строим одно ещё не созданное задание за такт, чтобы не задерживать ввод
+        for index in TASK_FACTORIES:
+            if index not in self.tasks:
+                self.task_widget(index)
+                return
+        self.warm_up_timer.stop()
+
+    def closeEvent(self, event):
+        self.prefetcher.close()
+        if self.journal is not None:
+            self.journal.close()
+        super().closeEvent(event)
+
     def open_settings(self):
-        dialog = SettingsDialog(self, self.text_scale, self.ui_scale)
+        dialog = SettingsDialog(
+            self, self.text_scale, self.ui_scale,
+            apply_on_release=self.settings.value("apply_on_release", False, type=bool),
+        )
         if dialog.exec_() == QDialog.Accepted:
             # Значения уже применены через сигналы при изменении ползунков
             # Но мы можем получить их снова для сохранения
@@ -3595,118 +1304,64 @@ class MathTrainer(QMainWindow):
             # Сохраняем в настройки
             self.settings.setValue("text_scale", self.text_scale)
             self.settings.setValue("ui_scale", self.ui_scale)
+            self.settings.setValue("apply_on_release", dialog.apply_on_release())
             # Обновляем кнопки на панели
             self.apply_text_scaling(self.text_scale)
             self.apply_ui_scaling(self.ui_scale)
 
 
-    def apply_text_scaling(self, scale):
-        self.text_scale = scale
-        # Обновить стиль кнопки настроек
-        settings_btn_style = f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """
-        self.settings_btn.setStyleSheet(settings_btn_style)
-
-        # Обновить стиль кнопок заданий
-        for btn in self.task_buttons:
-            task_btn_style = f"""
-            QPushButton {{
-                background-color: #ffffff;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 6px 22px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(50 * self.ui_scale)}px;
-                min-height: {int(40 * self.ui_scale)}px;
-            }}
-            QPushButton:checked {{
-                background-color: #007acc;
-                color: white;
-                border: 1px solid #005fa3;
-            }}
-            """
-            btn.setStyleSheet(task_btn_style)
-
-        # Обновить текущее задание
+    def apply_window_styles(self):
+        # Одна таблица стилей на панель и одна на клавиатуру вместо отдельной на каждую кнопку
+        self.top_bar_widget.setStyleSheet(styles.compile_stylesheet("top_bar", self.text_scale, self.ui_scale))
+        self.keyboard.setStyleSheet(styles.compile_stylesheet("keyboard", self.text_scale, self.ui_scale))
+
+    def on_key_pressed(self, char):
         if self.current_task_widget:
-            self.current_task_widget.apply_text_scaling(scale)
+            self.current_task_widget.append_to_active_input(char)
+
+    def apply_text_scaling(self, scale):
+        self.set_scales(scale, self.ui_scale)
 
     def apply_ui_scaling(self, scale):
-        self.ui_scale = scale
-        # Обновить стиль кнопки настроек
-        settings_btn_style = f"""
-        QPushButton {{
-            background-color: #f0f0f0;
-            border: 1px solid #ccc;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: {int(60 * self.text_scale)}px;
-            color: black;
-            min-width: {int(100 * self.ui_scale)}px;
-            min-height: {int(50 * self.ui_scale)}px;
-        }}
-        QPushButton:hover {{
-            background-color: #e0e0e0;
-        }}
-        """
-        self.settings_btn.setStyleSheet(settings_btn_style)
-
-        # Обновить стиль кнопок заданий
-        for btn in self.task_buttons:
-            task_btn_style = f"""
-            QPushButton {{
-                background-color: #ffffff;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                padding: 6px 22px;
-                font-size: {int(60 * self.text_scale)}px;
-                color: black;
-                min-width: {int(50 * self.ui_scale)}px;
-                min-height: {int(40 * self.ui_scale)}px;
-            }}
-            QPushButton:checked {{
-                background-color: #007acc;
-                color: white;
-                border: 1px solid #005fa3;
-            }}
-            """
-            btn.setStyleSheet(task_btn_style)
-
-        # Обновить текущее задание
+        self.set_scales(self.text_scale, scale)
+
+    def set_scales(self, text_scale, ui_scale):
+        """Меняет масштаб; каждое изменение открывает новую эпоху, повтор того же масштаба пропускается."""
+        if (text_scale, ui_scale) == (self.text_scale, self.ui_scale):
+            self.restyles["skipped"] += 1
+            return
+        self.text_scale = text_scale
+        self.ui_scale = ui_scale
+        self.scale_epoch += 1
+        self.apply_window_styles()
+
+        # Обновить текущее задание; скрытые обновятся при показе
         if self.current_task_widget:
-            self.current_task_widget.apply_ui_scaling(scale)
+            self.sync_task_scale(self.current_task_widget)
+
+    def sync_task_scale(self, task):
+        # Перерисовываем задание, только если масштаб менялся с его последнего показа
+        if task.scale_epoch == self.scale_epoch:
+            self.restyles["skipped"] += 1
+            return
+        task.apply_scaling(self.text_scale, self.ui_scale)
+        task.scale_epoch = self.scale_epoch
+        self.restyles["applied"] += 1
 
     def select_task(self, index):
         # Сбросить предыдущее состояние
         if self.current_task_widget:
-            # Сбросить состояние текущего задания перед удалением
-            self.current_task_widget.reset_task()
-            self.content_area.removeWidget(self.current_task_widget)
-            self.current_task_widget.setParent(None)
+            # Скрытое задание не перегенерируем сразу — только при следующем показе
+            self.current_task_widget.mark_stale()
 
         # Выбрать новое задание
-        task_idx = index - 1
-        if 0 <= task_idx < len(self.tasks) and self.tasks[task_idx]:
-            self.current_task_widget = self.tasks[task_idx]
-            # Применить масштабирование при переключении
-            self.current_task_widget.apply_text_scaling(self.text_scale)
-            self.current_task_widget.apply_ui_scaling(self.ui_scale)
-            self.current_task_widget.generate_task()  # Новый пример при выборке
-            self.content_area.addWidget(self.current_task_widget)
+        if index in TASK_FACTORIES:
+            self.current_task_widget = self.task_widget(index)
+            # Применить масштабирование, если оно менялось, пока задание было скрыто
+            self.sync_task_scale(self.current_task_widget)
+            self.current_task_widget.refresh()  # Новый пример при выборке
+            self.task_stack.setCurrentWidget(self.current_task_widget)
+            self.keyboard.set_extra_key(self.current_task_widget.extra_key)
 
             # Обновить активную кнопку
             for btn in self.task_buttons:
@@ -3714,8 +1369,84 @@ class MathTrainer(QMainWindow):
             self.task_buttons[index - 1].setChecked(True)
 
 
+class StartupProfiler(QObject):
+    """Замеры запуска для --profile-startup: дожидается первой отрисовки окна и пишет JSON."""
+
+    def __init__(self, path, window, timings):
+        super().__init__()
+        self.path = path
+        self.window = window
+        self.timings = timings
+        self.shown_at = None  # Когда вернулся window.show()
+        QApplication.instance().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and isinstance(obj, QWidget) and obj.window() is self.window:
+            QApplication.instance().removeEventFilter(self)
+            self.timings["first_paint"] = time.perf_counter() - self.shown_at
+            self.timings["time_to_first_paint"] = time.perf_counter() - STARTED
+            # Пишем после того, как отрисовка завершится
+            QTimer.singleShot(0, self.write)
+        return False
+
+    def write(self):
+        report = {
+            "fast_start": self.window.fast_start,
+            "imports": {
+                "pyqt5": PYQT_IMPORTED - STARTED,
+                "app_modules": MODULES_IMPORTED - PYQT_IMPORTED,
+            },
+        }
+        report.update(self.timings)
+        report["tasks"] = {str(index): seconds for index, seconds in self.window.build_times.items()}
+        with open(self.path, "w", encoding="utf-8") as out:
+            json.dump(_to_ms(report), out, ensure_ascii=False, indent=2)
+        print(f"Замеры запуска записаны в {self.path}", file=sys.stderr)
+
+
+def _to_ms(value):
+    # Секунды -> миллисекунды с точностью до сотых
+    if isinstance(value, dict):
+        return {key: _to_ms(item) for key, item in value.items()}
+    if isinstance(value, float):
+        return round(value * 1000, 2)
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Математический тренажёр 6 класс.")
+    parser.add_argument(
+        "--profile-startup", metavar="FILE", nargs="?", const="startup_profile.json",
+        help="записать замеры запуска (мс) в JSON-файл (по умолчанию startup_profile.json)",
+    )
+    parser.add_argument(
+        "--fast-start", action="store_true",
+        help="откладывать всё, что не нужно первому заданию, до показа окна",
+    )
+    return parser
+
+
 def main():
-    app = QApplication(sys.argv)
+    # Массовая генерация без интерфейса: python main.py generate --task 7 --count 1000
+    if len(sys.argv) > 1 and sys.argv[1] == "generate":
+        # Модуль нужен только здесь, окну его импорт не нужен
+        import bulk
+        sys.exit(bulk.main(sys.argv[2:]))
+
+    # Проверка собранных ответов: python main.py grade answers.csv --summary summary.json
+    if len(sys.argv) > 1 and sys.argv[1] == "grade":
+        import bulk_grade
+        sys.exit(bulk_grade.main(sys.argv[2:]))
+
+    # Свои флаги разбираем сами, остальные аргументы передаём Qt
+    args, qt_args = build_parser().parse_known_args(sys.argv[1:])
+    timings = {}
+
+    started = time.perf_counter()
+    app = QApplication(sys.argv[:1] + qt_args)
+    timings["qapplication"] = time.perf_counter() - started
+
+    started = time.perf_counter()
     # Дополнительно: принудительно установить светлую палитру
     palette = QPalette()
     palette.setColor(QPalette.Window, QColor(255, 255, 255))
@@ -3728,9 +1459,21 @@ def main():
     palette.setColor(QPalette.Highlight, QColor(0, 120, 215))
     palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
     app.setPalette(palette)
+    timings["palette"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    window = MathTrainer(fast_start=args.fast_start)
+    timings["main_window"] = time.perf_counter() - started
+
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler(args.profile_startup, window, timings)
 
-    window = MathTrainer()
+    started = time.perf_counter()
     window.show()
+    timings["show"] = time.perf_counter() - started
+    if profiler is not None:
+        profiler.shown_at = time.perf_counter()
     sys.exit(app.exec_())
 
 
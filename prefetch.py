@@ -0,0 +1,81 @@
+"""Фоновая подготовка условий: следующее задание показывается без ожидания генерации.
+
+ProblemPrefetcher держит для каждого задания ограниченную очередь готовых условий
+и пополняет её в одном фоновом потоке. get() берёт условие из очереди (попадание)
+или, если очередь пуста, генерирует его сразу (промах).
+"""
+import random
+import threading
+from collections import Counter, deque
+
+import problems
+
+DEFAULT_DEPTH = 4
+
+
+class ProblemPrefetcher:
+    def __init__(self, task_ids, depth=DEFAULT_DEPTH, start=True):
+        self.depth = depth
+        self.hits = Counter()
+        self.misses = Counter()
+        self._queues = {task_id: deque() for task_id in task_ids}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._rng = random.Random()
+        self._thread = None
+        if start:
+            self.start()
+
+    def start(self):
+        """Запускает фоновый поток; до этого get() генерирует условия синхронно."""
+        if self._thread is None and self.depth > 0 and not self._closed:
+            self._thread = threading.Thread(target=self._run, name="problem-prefetch", daemon=True)
+            self._thread.start()
+
+    def _next_task(self):
+        # Задание с самой короткой очередью, если она ещё не заполнена
+        task_id = min(self._queues, key=lambda t: len(self._queues[t]))
+        if len(self._queues[task_id]) < self.depth:
+            return task_id
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                task_id = self._next_task()
+                while task_id is None and not self._closed:
+                    self._cond.wait()
+                    task_id = self._next_task()
+                if self._closed:
+                    return
+            # Генерируем вне блокировки, чтобы не задерживать get()
+            problem = problems.generate(task_id, self._rng)
+            with self._cond:
+                self._queues[task_id].append(problem)
+
+    def get(self, task_id):
+        """Готовое условие задания task_id; при пустой очереди генерирует его синхронно."""
+        with self._cond:
+            queue = self._queues[task_id]
+            if queue:
+                self.hits[task_id] += 1
+                problem = queue.popleft()
+                self._cond.notify()
+                return problem
+            self.misses[task_id] += 1
+        return problems.generate(task_id)
+
+    def stats(self):
+        """Счётчики попаданий и промахов и текущая длина очереди по заданиям."""
+        with self._cond:
+            return {
+                task_id: {"hits": self.hits[task_id], "misses": self.misses[task_id], "queued": len(queue)}
+                for task_id, queue in self._queues.items()
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
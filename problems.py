@@ -0,0 +1,792 @@
+"""Генерация условий заданий без зависимости от PyQt5.
+
+Каждое задание описывается компактной записью с __slots__ (Task1Problem ... Task10Problem),
+а функция generate_taskN(rng) создаёт новую запись. Виджеты из main.py только
+отображают эти записи, поэтому задания можно генерировать без QApplication.
+
+Условие, выданное через generate(), целиком задаётся 8-байтовым ключом
+(номер задания, версия генератора, 56-битное зерно): problem_from_key(key)
+восстанавливает по нему те же параметры и ответ на любой машине. Поэтому
+журналам, контрольным и ключам ответов достаточно хранить только ключ.
+"""
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import Counter
+from fractions import Fraction
+from itertools import accumulate, chain
+
+
+_MASK64 = (1 << 64) - 1
+
+
+class KeyRandom(random.Random):
+    """Генератор splitmix64 для восстановления условия по ключу.
+
+    Посев дешевле, чем у Mersenne Twister, а последовательность зависит только
+    от ключа. randint, choice, choices и uniform из random.Random строятся
+    поверх random() и getrandbits(), поэтому генераторы заданий работают с ним
+    без изменений.
+    """
+
+    def seed(self, a=0, version=2):
+        self._state = a & _MASK64
+
+    def getstate(self):
+        return self._state
+
+    def setstate(self, state):
+        self._state = state
+
+    def _next(self):
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def random(self):
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value = 0
+        for _ in range(-(-k // 64)):
+            value = (value << 64) | self._next()
+        return value >> (-k % 64)
+
+
+class GenerationBudget:
+    """Ограничение на число попыток и время одной генерации задания."""
+
+    def __init__(self, max_iterations, max_seconds):
+        self.max_iterations = max_iterations
+        self.max_seconds = max_seconds
+
+    def attempts(self, rng=None):
+        """Номера попыток, пока не исчерпан бюджет по числу итераций или по времени.
+
+        Для KeyRandom ограничение по времени не действует: иначе условие
+        зависело бы от скорости машины, а не только от ключа.
+        """
+        if isinstance(rng, KeyRandom):
+            yield from range(self.max_iterations)
+            return
+        deadline = time.perf_counter() + self.max_seconds
+        for attempt in range(self.max_iterations):
+            if attempt and time.perf_counter() > deadline:
+                return
+            yield attempt
+
+
+# Бюджеты заданий, в которых остался цикл с перегенерацией.
+# Остальные задания выбирают параметры за один шаг.
+GENERATION_BUDGETS = {
+    2: GenerationBudget(max_iterations=100, max_seconds=0.01),
+    7: GenerationBudget(max_iterations=20000, max_seconds=0.05),
+}
+
+# Заранее проверенные условия на случай исчерпания бюджета
+FALLBACK_POOLS = {
+    # (a, b, c, d, e, f)
+    2: (
+        (7, 3, 5, 4, 12, 7),
+        (8, 5, 9, 7, 6, 5),
+        (5, 2, 7, 6, 20, 9),
+        (9, 4, 4, 3, 15, 8),
+    ),
+    # ((числитель, знаменатель) для б, в, г, д; е)
+    7: (
+        ((4, 7), (2, 9), (3, 11), (37, 4), 9),
+        ((1, 5), (7, 12), (7, 8), (25, 4), 3),
+        ((1, 4), (7, 5), (2, 5), (49, 5), 4),
+        ((3, 5), (2, 7), (7, 6), (37, 5), 3),
+        ((1, 3), (13, 12), (1, 4), (41, 6), 3),
+    ),
+}
+
+# Сколько раз каждое задание исчерпало бюджет и взяло условие из запасного набора
+BUDGET_OVERRUNS = Counter()
+
+
+def fallback_problem(task_id, rng=random):
+    """Учитывает перерасход бюджета и возвращает случайное условие из запасного набора."""
+    BUDGET_OVERRUNS[task_id] += 1
+    return rng.choice(FALLBACK_POOLS[task_id])
+
+
+def generation_metrics():
+    """Счётчики перерасхода бюджета генерации по номерам заданий."""
+    return {task_id: BUDGET_OVERRUNS[task_id] for task_id in GENERATION_BUDGETS}
+
+
+# Пары (C, D) задания 5 в десятых долях, сгруппированные по A - B
+_TASK5_PAIRS = {}
+
+
+def task5_pairs(k):
+    """Возвращает все пары (C, D) в десятых (1,1..9,9 -> 11..99), у которых C + D делится на k."""
+    pairs = _TASK5_PAIRS.get(k)
+    if pairs is None:
+        pairs = tuple(
+            (c, d)
+            for c in range(11, 100)
+            for d in range(11, 100)
+            if (c + d) % k == 0
+        )
+        _TASK5_PAIRS[k] = pairs
+    return pairs
+
+
+# Пространство допустимых условий задания 6 и накопленные веса для выборки
+_TASK6_SPACE = None
+
+
+def task6_space():
+    """Возвращает (space, cum_weights): все допустимые (a, b, c, t2) задания 6 и веса для выборки.
+
+    Веса повторяют распределение прежнего цикла с перегенерацией: при t2 >= 10
+    он перевыбирал только a и b, сохраняя c, поэтому вероятность каждого c
+    пропорциональна доле подходящих (a, b) среди попыток, не отброшенных по t2 >= 10.
+    """
+    global _TASK6_SPACE
+    if _TASK6_SPACE is None:
+        a_values = range(100, 1000, 10)  # Трёхзначное, кратное 10
+        b_values = range(2, 9)           # Время в первый день
+        space = []
+        weights = []
+        for c in (5, 10, 15, 20, 25):
+            valid = []
+            too_long = 0
+            for a in a_values:
+                for b in b_values:
+                    speed2 = Fraction(a, b) - c
+                    if speed2 <= 0:
+                        # Скорость на обратном пути должна быть положительной
+                        continue
+                    t2 = a / speed2
+                    if t2 >= 10:
+                        too_long += 1
+                    elif (t2 * 10).denominator == 1 and t2 * 10 % 10 == 5:
+                        # t2 имеет формат X.5
+                        valid.append((a, b, c, float(t2)))
+            weight = 1 / (len(a_values) * len(b_values) - too_long)
+            space.extend(valid)
+            weights.extend([weight] * len(valid))
+
+        cum_weights = []
+        total = 0.0
+        for weight in weights:
+            total += weight
+            cum_weights.append(total)
+        _TASK6_SPACE = (tuple(space), tuple(cum_weights))
+    return _TASK6_SPACE
+
+
+# Каталог условий задания 7 собирается офлайн скриптом tools/build_task7_catalog.py
+TASK7_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "task7_catalog.bin")
+TASK7_CATALOG_MAGIC = b"T7CT"
+TASK7_CATALOG_VERSION = 1
+_TASK7_CATALOG = None  # None — ещё не загружали, False — загрузить не удалось
+
+
+class Task7Catalog:
+    """Все условия задания 7 с ответом -1/N, сгруппированные по N."""
+
+    def __init__(self, values_b, values_v, groups):
+        self.values_b = values_b
+        self.values_v = values_v
+        self.groups = groups  # {N: array кодов условий}
+        self.size = sum(len(codes) for codes in groups.values())
+
+    def __len__(self):
+        return self.size
+
+    def problem(self, n, code):
+        """Восстанавливает (frac_b, frac_v, frac_g, frac_d, e) по коду условия из группы N."""
+        nv = len(self.values_v)
+        e = code % 8 + 2
+        code //= 8
+        frac_g = self.values_v[code % nv]
+        code //= nv
+        frac_v = self.values_v[code % nv]
+        frac_b = self.values_b[code // nv]
+        # д / е = (1 + б)(в + г) + 1/N
+        frac_d = e * ((1 + frac_b) * (frac_v + frac_g) + Fraction(1, n))
+        return frac_b, frac_v, frac_g, frac_d, e
+
+    def sample(self, rng=random):
+        """Равновероятно выбирает одно условие из каталога."""
+        index = rng.randrange(self.size)
+        for n, codes in self.groups.items():
+            if index < len(codes):
+                return self.problem(n, codes[index])
+            index -= len(codes)
+
+
+def load_task7_catalog(path=TASK7_CATALOG_PATH):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = struct.unpack_from("<4sH", data)
+    if magic != TASK7_CATALOG_MAGIC or version != TASK7_CATALOG_VERSION:
+        raise ValueError(f"Неподдерживаемый каталог задания 7: {path}")
+    payload = zlib.decompress(data[struct.calcsize("<4sH"):])
+
+    offset = 0
+    tables = []
+    for _ in range(2):
+        (count,) = struct.unpack_from("<B", payload, offset)
+        offset += 1
+        pairs = struct.unpack_from(f"<{2 * count}B", payload, offset)
+        offset += 2 * count
+        tables.append(tuple(Fraction(pairs[i], pairs[i + 1]) for i in range(0, 2 * count, 2)))
+
+    groups = {}
+    for n in range(2, 10):
+        count, first = struct.unpack_from("<II", payload, offset)
+        offset += 8
+        deltas = array("H")
+        deltas.frombytes(payload[offset:offset + 2 * (count - 1)])
+        offset += 2 * (count - 1)
+        if sys.byteorder == "big":
+            deltas.byteswap()
+        groups[n] = array("I", accumulate(chain((first,), deltas)))
+
+    values_b, values_v = tables
+    return Task7Catalog(values_b, values_v, groups)
+
+
+def task7_catalog():
+    """Лениво загружает каталог задания 7; None, если файл каталога недоступен."""
+    global _TASK7_CATALOG
+    if _TASK7_CATALOG is None:
+        try:
+            _TASK7_CATALOG = load_task7_catalog()
+        except (OSError, ValueError, struct.error, zlib.error):
+            # Запоминаем неудачу, чтобы не читать файл заново при каждой генерации
+            _TASK7_CATALOG = False
+    return _TASK7_CATALOG or None
+
+
+def draw_task7_fractions(rng=random):
+    """Случайные дроби задания 7 без проверки ответа (запасной путь без каталога)."""
+    # б: дробь, числитель < знаменателя, знаменатель от 3 до 8
+    den_b = rng.randint(3, 8)
+    num_b = rng.randint(1, den_b - 1)
+    frac_b = Fraction(num_b, den_b)
+
+    # в: дробь, числитель может быть >= знаменателя, но не кратен ему
+    den_v = rng.randint(4, 12)
+    num_v = rng.randint(1, den_v + 2)
+    while num_v % den_v == 0:
+        num_v = rng.randint(1, den_v + 2)
+    frac_v = Fraction(num_v, den_v)
+
+    # г: аналогично в, но НЕ совпадает с в
+    while True:
+        den_g = rng.randint(4, 12)
+        num_g = rng.randint(1, den_g + 2)
+        while num_g % den_g == 0:
+            num_g = rng.randint(1, den_g + 2)
+        frac_g = Fraction(num_g, den_g)
+        if frac_g != frac_v:
+            break  # Успешно сгенерирована дробь, отличающаяся от frac_v
+
+    # д: числитель от 3*den до 13*den, знаменатель от 3 до 7
+    den_d = rng.randint(3, 7)
+    num_d = rng.randint(3 * den_d, 13 * den_d)
+    while num_d % den_d == 0:
+        num_d = rng.randint(3 * den_d, 13 * den_d)
+    frac_d = Fraction(num_d, den_d)
+
+    # е: целое число от 2 до 9
+    e = rng.randint(2, 9)
+    return frac_b, frac_v, frac_g, frac_d, e
+
+
+# Таблица делителей задания 8: (b, x) -> допустимое число квартир
+_TASK8_TABLE = None
+
+
+def task8_floors(b):
+    """Числа этажей y от 6 до 25, кратные b."""
+    return range(-(-6 // b) * b, 26, b)
+
+
+def task8_table():
+    """Возвращает {(b, x): трёхзначные числа квартир, кратные x} для задания 8."""
+    global _TASK8_TABLE
+    if _TASK8_TABLE is None:
+        table = {}
+        for b in range(2, 7):
+            for y in task8_floors(b):
+                x = y // b  # Квартир на этаже
+                table[(b, x)] = tuple(range(-(-100 // x) * x, 1000, x))
+        _TASK8_TABLE = table
+    return _TASK8_TABLE
+
+
+# Индекс допустимых комбинаций задания 9: строится один раз на процесс
+# и разделяется всеми экземплярами Task9
+_TASK9_INDEX = None
+
+
+def task9_index():
+    """Возвращает неизменяемый кортеж допустимых комбинаций (a, b, v, total) для задания 9."""
+    global _TASK9_INDEX
+    if _TASK9_INDEX is None:
+        valid_combinations = []
+        for a in range(20, 31):
+            for b in range(2, 10):
+                for v in range(20, 31):
+                    if (a * v) % 100 != 0:
+                        continue
+                    class_a = a
+                    class_b = a - b
+                    class_c = a - (a * v // 100)
+                    total = class_a + class_b + class_c
+
+                    if 50 <= total <= 90:
+                        valid_combinations.append((a, b, v, total))
+
+        if not valid_combinations:
+            # Если нет валидных комбинаций, бросить исключение
+            raise RuntimeError("No valid combinations found for Task9 parameters.")
+
+        _TASK9_INDEX = tuple(valid_combinations)
+    return _TASK9_INDEX
+
+
+class Problem:
+    """Базовая запись условия: параметры задания и правильный ответ."""
+
+    __slots__ = ("key",)  # Ключ условия (см. make_key) или None, если условие задано параметрами
+    task_id = None
+    param_names = ()
+    # Тип параметров, которые не целые (float — десятичная дробь, Fraction — обыкновенная);
+    # целое число подходит для любого параметра
+    param_types = {}
+    answer_form = "decimal"  # Какой ввод принимается: см. grading.FORM_SHAPES
+
+    def __new__(cls, *args):
+        self = object.__new__(cls)
+        self.key = None
+        return self
+
+    def params(self):
+        """Параметры условия в виде словаря {имя: значение}."""
+        return {name: getattr(self, name) for name in self.param_names}
+
+    def answer_text(self):
+        """Правильный ответ в том виде, в каком его показывает приложение."""
+        return str(self.correct_answer)
+
+    def exact_answer(self):
+        """Правильный ответ точной дробью (для проверки без погрешностей float)."""
+        return Fraction(self.correct_answer)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.params() == other.params()
+
+    def __hash__(self):
+        return hash((self.task_id,) + tuple(self.params().values()))
+
+    def __repr__(self):
+        args = ", ".join(f"{name}={value!r}" for name, value in self.params().items())
+        return f"{type(self).__name__}({args})"
+
+
+class Task1Problem(Problem):
+    """A × (B – C)."""
+
+    __slots__ = ("a", "b", "c", "correct_answer")
+    task_id = 1
+    param_names = ("a", "b", "c")
+
+    def __init__(self, a, b, c):
+        self.a, self.b, self.c = a, b, c
+        self.correct_answer = a * (b - c)
+
+
+class Task2Problem(Problem):
+    """(a/b – c/d) ÷ e/f."""
+
+    __slots__ = ("a", "b", "c", "d", "e", "f", "correct_answer")
+    task_id = 2
+    param_names = ("a", "b", "c", "d", "e", "f")
+    answer_form = "fraction"
+
+    def __init__(self, a, b, c, d, e, f):
+        self.a, self.b, self.c, self.d, self.e, self.f = a, b, c, d, e, f
+        self.correct_answer = (Fraction(a, b) - Fraction(c, d)) / Fraction(e, f)
+
+    def answer_text(self):
+        # Ответ всегда дробью, даже если он целый, — как его вводят в два поля
+        return f"{self.correct_answer.numerator}/{self.correct_answer.denominator}"
+
+
+class Task3Problem(Problem):
+    """a – b × (c) с десятичными дробями."""
+
+    __slots__ = ("a", "b", "c", "correct_answer")
+    task_id = 3
+    param_names = ("a", "b", "c")
+    param_types = {"a": float, "b": float, "c": float}
+
+    def __init__(self, a, b, c):
+        self.a, self.b, self.c = a, b, c
+        self.correct_answer = a - b * c
+
+    def answer_text(self):
+        return str(round(self.correct_answer, 2))
+
+    def exact_answer(self):
+        # a, b, c — конечные десятичные дроби, считаем по их десятичной записи
+        return Fraction(str(self.a)) - Fraction(str(self.b)) * Fraction(str(self.c))
+
+
+class Task4Problem(Problem):
+    """A × |y + B| при y = C."""
+
+    __slots__ = ("a", "b", "c", "correct_answer")
+    task_id = 4
+    param_names = ("a", "b", "c")
+
+    def __init__(self, a, b, c):
+        self.a, self.b, self.c = a, b, c
+        self.correct_answer = a * abs(c + b)
+
+
+class Task5Problem(Problem):
+    """Ax – Bx = C + D."""
+
+    __slots__ = ("a", "b", "c", "d", "correct_answer")
+    task_id = 5
+    param_names = ("a", "b", "c", "d")
+    param_types = {"c": float, "d": float}
+
+    def __init__(self, a, b, c, d):
+        self.a, self.b, self.c, self.d = a, b, c, d
+        # x = (C + D) / (A - B), считаем в десятых долях
+        self.correct_answer = (round(c * 10) + round(d * 10)) / (a - b) / 10
+
+    def answer_text(self):
+        return f"{self.correct_answer:.1f}"
+
+    def exact_answer(self):
+        return Fraction(round(self.c * 10) + round(self.d * 10), (self.a - self.b) * 10)
+
+
+class Task6Problem(Problem):
+    """Задача на движение: время на обратный путь."""
+
+    __slots__ = ("a", "b", "c", "correct_answer")
+    task_id = 6
+    param_names = ("a", "b", "c")
+
+    def __init__(self, a, b, c):
+        self.a, self.b, self.c = a, b, c
+        self.correct_answer = float(a / (Fraction(a, b) - c))
+
+    def answer_text(self):
+        return f"{self.correct_answer:.1f}"
+
+    def exact_answer(self):
+        return self.a / (Fraction(self.a, self.b) - self.c)
+
+
+class Task7Problem(Problem):
+    """1б × (в + г) – д ÷ е с ответом вида -1/N."""
+
+    __slots__ = ("frac_b", "frac_v", "frac_g", "frac_d", "e", "correct_answer")
+    task_id = 7
+    param_names = ("frac_b", "frac_v", "frac_g", "frac_d", "e")
+    param_types = {"frac_b": Fraction, "frac_v": Fraction, "frac_g": Fraction, "frac_d": Fraction}
+    answer_form = "fraction"
+
+    def __init__(self, frac_b, frac_v, frac_g, frac_d, e):
+        self.frac_b, self.frac_v, self.frac_g, self.frac_d, self.e = frac_b, frac_v, frac_g, frac_d, e
+        self.correct_answer = (1 + frac_b) * (frac_v + frac_g) - frac_d / e
+
+
+class Task8Problem(Problem):
+    """Число этажей в доме из a квартир."""
+
+    __slots__ = ("a", "b", "y", "correct_answer")
+    task_id = 8
+    param_names = ("a", "b", "y")
+    answer_form = "integer"
+
+    def __init__(self, a, b, y):
+        self.a, self.b, self.y = a, b, y
+        self.correct_answer = y
+
+
+class Task9Problem(Problem):
+    """Общее число учеников в трёх классах."""
+
+    __slots__ = ("a", "b", "v", "correct_answer")
+    task_id = 9
+    param_names = ("a", "b", "v")
+    answer_form = "integer"
+
+    def __init__(self, a, b, v):
+        self.a, self.b, self.v = a, b, v
+        self.correct_answer = a + (a - b) + (a - a * v // 100)
+
+
+class Task10Problem(Problem):
+    """Задуманное двузначное число, кратное 10."""
+
+    __slots__ = ("a", "b", "correct_answer")
+    task_id = 10
+    param_names = ("a", "b")
+    answer_form = "integer"
+
+    def __init__(self, a, b):
+        self.a, self.b = a, b
+        # (A * d) * 10 - d * 10 = B => d = B / ((A - 1) * 10)
+        self.correct_answer = b // ((a - 1) * 10) * 10
+
+
+PROBLEM_TYPES = {
+    problem_type.task_id: problem_type
+    for problem_type in (
+        Task1Problem, Task2Problem, Task3Problem, Task4Problem, Task5Problem,
+        Task6Problem, Task7Problem, Task8Problem, Task9Problem, Task10Problem,
+    )
+}
+
+
+def generate_task1(rng=random):
+    a = rng.randint(2, 10)
+    b = rng.randint(20, 90)
+    c = rng.randint(b + 1, 99)  # Ensure B < C
+    return Task1Problem(a, b, c)
+
+
+def generate_task2(rng=random):
+    # Генерация чисел
+    b = rng.randint(2, 8)
+    a = rng.randint(b + 1, 9)
+    d = rng.randint(2, 8)
+    c = rng.randint(d + 1, 9)
+    e = rng.randint(5, 25)
+    for _ in GENERATION_BUDGETS[2].attempts(rng):
+        f = rng.randint(5, 9)
+        if f != e:
+            break
+    else:
+        a, b, c, d, e, f = fallback_problem(2, rng)
+    return Task2Problem(a, b, c, d, e, f)
+
+
+def generate_task3(rng=random):
+    a = round(rng.uniform(1.20, 1.99), 2)
+    b = round(rng.uniform(0.1, 0.9), 1)
+    c = round(rng.uniform(-2.9, -1.2), 1)
+    return Task3Problem(a, b, c)
+
+
+def generate_task4(rng=random):
+    a = rng.randint(-9, -2)
+    b = rng.randint(2, 9)
+    c = rng.randint(-19, -10)
+    return Task4Problem(a, b, c)
+
+
+def generate_task5(rng=random):
+    a = rng.randint(10, 25)  # Чтобы гарантировать, что B < A
+    b = rng.randint(8, a - 1)
+
+    # Решаем: (A - B)x = C + D => x = (C + D) / (A - B)
+    # C и D берём в десятых долях сразу из пар, для которых x — конечная
+    # дробь с 1 знаком после запятой, т.е. C + D делится на A - B
+    tenths_c, tenths_d = rng.choice(task5_pairs(a - b))
+    return Task5Problem(a, b, tenths_c / 10, tenths_d / 10)
+
+
+def generate_task6(rng=random):
+    # Выбираем условие сразу из допустимых: t2 < 10 и имеет формат X.5
+    space, cum_weights = task6_space()
+    a, b, c, t2 = rng.choices(space, cum_weights=cum_weights)[0]
+    return Task6Problem(a, b, c)
+
+
+def generate_task7(rng=random):
+    catalog = task7_catalog()
+    if catalog is not None:
+        # Готовое условие с ответом вида -1/N из каталога
+        return Task7Problem(*catalog.sample(rng))
+
+    # Каталог недоступен: перегенерация, пока ответ не станет -1/N
+    for _ in GENERATION_BUDGETS[7].attempts(rng):
+        problem = Task7Problem(*draw_task7_fractions(rng))
+        result = problem.correct_answer
+        if result < 0 and result.numerator == -1 and 2 <= result.denominator <= 9:
+            return problem
+
+    *fractions, e = fallback_problem(7, rng)
+    return Task7Problem(*(Fraction(num, den) for num, den in fractions), e)
+
+
+def generate_task8(rng=random):
+    b = rng.randint(2, 6)  # Отношение этажей к квартирам на этаже
+    y = rng.choice(task8_floors(b))  # Число этажей, кратное b
+    x = y // b  # Квартир на этаже
+    a = rng.choice(task8_table()[(b, x)])  # Общее число квартир, кратное x
+    return Task8Problem(a, b, y)
+
+
+def generate_task9(rng=random):
+    # Выбираем случайную комбинацию из общего индекса
+    a, b, v, total = rng.choice(task9_index())
+    return Task9Problem(a, b, v)
+
+
+def generate_task10(rng=random):
+    # Генерируем A и B
+    a = rng.randint(2, 6)
+    # B от 10 до 90 сразу выбираем кратным (A - 1) * 10 — так же равновероятно,
+    # как прежняя перегенерация B, пока оно не поделится
+    denominator = (a - 1) * 10
+    b = rng.choice(range(denominator, 91, denominator))
+    return Task10Problem(a, b)
+
+
+GENERATORS = {
+    1: generate_task1,
+    2: generate_task2,
+    3: generate_task3,
+    4: generate_task4,
+    5: generate_task5,
+    6: generate_task6,
+    7: generate_task7,
+    8: generate_task8,
+    9: generate_task9,
+    10: generate_task10,
+}
+
+
+# Версия генератора каждого задания. Её нужно увеличить при любом изменении
+# generate_taskN, его таблиц или каталога, которое меняет условие для того же зерна:
+# старые ключи тогда перестают приниматься, а не восстанавливают другое условие.
+GENERATOR_VERSIONS = {task_id: 1 for task_id in GENERATORS}
+GENERATOR_VERSIONS[10] = 2  # B выбирается сразу из кратных, без перегенерации
+
+# Ключ: 4 бита номера задания, 4 бита версии генератора, 56 бит зерна
+SEED_BITS = 56
+VERSION_BITS = 4
+KEY_SIZE = 8  # байт
+
+
+def make_key(task_id, seed, version=None):
+    """Ключ условия задания task_id с зерном seed (текущая версия генератора по умолчанию)."""
+    # На номер задания и версию в ключе отведено по VERSION_BITS бит
+    if not 0 <= task_id < 1 << VERSION_BITS:
+        raise ValueError(f"номер задания вне диапазона 0..{(1 << VERSION_BITS) - 1}: {task_id}")
+    if version is None:
+        if task_id not in GENERATORS:
+            raise ValueError(f"нет задания {task_id}")
+        version = GENERATOR_VERSIONS[task_id]
+    if not 0 <= version < 1 << VERSION_BITS:
+        raise ValueError(f"версия генератора вне диапазона 0..{(1 << VERSION_BITS) - 1}: {version}")
+    if not 0 <= seed < 1 << SEED_BITS:
+        raise ValueError(f"зерно вне диапазона 0..2^{SEED_BITS}: {seed}")
+    return (task_id << (SEED_BITS + VERSION_BITS)) | (version << SEED_BITS) | seed
+
+
+def split_key(key):
+    """Разбирает ключ на (номер задания, версия генератора, зерно)."""
+    if not 0 <= key <= _MASK64:
+        raise ValueError(f"ключ вне диапазона 64 бит: {key}")
+    return key >> (SEED_BITS + VERSION_BITS), (key >> SEED_BITS) & 0xF, key & ((1 << SEED_BITS) - 1)
+
+
+def key_text(key):
+    """Ключ в виде 16 шестнадцатеричных цифр (так его пишут generate и журналы)."""
+    return f"{key:016x}"
+
+
+def parse_key(text):
+    return int(text, 16)
+
+
+def pack_keys(keys):
+    """Ключи в виде байтов: по KEY_SIZE байт на условие, little-endian."""
+    data = array("Q", keys)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def unpack_keys(data):
+    keys = array("Q")
+    keys.frombytes(data)
+    if sys.byteorder == "big":
+        keys.byteswap()
+    return keys
+
+
+def problem_from_key(key):
+    """Восстанавливает условие по ключу; одинаковый ключ всегда даёт одно и то же условие."""
+    task_id, version, _ = split_key(key)
+    if task_id not in GENERATORS:
+        raise ValueError(f"нет задания {task_id}")
+    if version != GENERATOR_VERSIONS[task_id]:
+        raise ValueError(f"задание {task_id}: версия генератора {version} не поддерживается")
+    if task_id == 7 and task7_catalog() is None:
+        # Без каталога задание 7 генерируется перебором, и условие будет другим
+        raise ValueError("задание 7: каталог условий недоступен")
+    problem = GENERATORS[task_id](KeyRandom(key))
+    problem.key = key
+    return problem
+
+
+def generate(task_id, rng=random):
+    """Новое условие задания task_id (1..10) со случайным ключом.
+
+    Без каталога задание 7 генерируется перебором прямо из rng: такое условие
+    по ключу не восстановить, поэтому его key остаётся None.
+    """
+    if task_id == 7 and task7_catalog() is None:
+        return generate_task7(rng)
+    return problem_from_key(make_key(task_id, rng.getrandbits(SEED_BITS)))
+
+
+def _param_value(value):
+    # Значения из CSV приходят строками: "3/8" — обыкновенная дробь, "1.5" — десятичная
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    if "/" in value:
+        return Fraction(value)
+    if "." in value:
+        return float(value)
+    return int(value)
+
+
+_TYPE_NAMES = {int: "целым числом", float: "десятичной дробью", Fraction: "обыкновенной дробью"}
+
+
+def problem_from_params(task_id, params):
+    """Условие задания task_id по словарю параметров (как их пишет генерация без интерфейса)."""
+    problem_type = PROBLEM_TYPES[task_id]
+    values = []
+    for name in problem_type.param_names:
+        value = _param_value(params[name])
+        expected = problem_type.param_types.get(name, int)
+        # bool — тоже int, но параметром задания он быть не может
+        if isinstance(value, bool) or not isinstance(value, (int, expected)):
+            raise TypeError(f"задание {task_id}: параметр {name} должен быть {_TYPE_NAMES[expected]}, а не {value!r}")
+        values.append(value)
+    return problem_type(*values)
+
+
+def problem_from_seed(task_id, seed):
+    """Условие задания task_id, однозначно заданное зерном seed (текущая версия генератора)."""
+    return problem_from_key(make_key(task_id, seed))
@@ -0,0 +1,145 @@
+"""Компилятор таблиц стилей: одна таблица на (роль, text_scale, ui_scale).
+
+Стиль задаётся не каждой кнопке и полю по отдельности, а одной таблицей на
+контейнере (задании, верхней панели или клавиатуре). Элементы различаются
+по objectName и динамическим свойствам, поэтому при смене масштаба Qt
+разбирает одну таблицу на контейнер.
+Готовые таблицы хранятся в ограниченном LRU-кэше.
+"""
+from functools import lru_cache
+
+CACHE_SIZE = 32
+
+
+def _task_stylesheet(text_scale, ui_scale):
+    font_px = int(60 * text_scale)
+    return f"""
+        QScrollArea {{
+            border: none;
+        }}
+        QLabel#task_label {{
+            font-size: {int(60 * text_scale)}pt;
+        }}
+        QLabel#task_display, QLabel#fraction_line, QLabel#result_label {{
+            font-size: {font_px}px;
+        }}
+        QLabel#result_label[verdict="correct"] {{
+            color: green;
+        }}
+        QLabel#result_label[verdict="wrong"] {{
+            color: red;
+        }}
+        QLabel#result_label[verdict="invalid"] {{
+            color: orange;
+        }}
+        QLineEdit#answer {{
+            background-color: white;
+            border: 2px solid #ccc;
+            border-radius: 8px;
+            padding: 8px;
+            font-size: {font_px}px;
+            color: black;
+        }}
+        QLineEdit#answer:focus {{
+            border: 2px solid #007acc;
+        }}
+        QLineEdit#answer[variant="wide"] {{
+            width: {int(300 * text_scale)}px;
+            height: {int(60 * text_scale)}px;
+        }}
+        QLineEdit#answer[variant="fraction"] {{
+            min-width: {int(80 * text_scale)}px;
+            width: {int(200 * text_scale)}px;
+            height: {int(60 * text_scale)}px;
+        }}
+        QLineEdit#answer[variant="small_font"] {{
+            font-size: {int(40 * text_scale)}px;
+            width: {int(200 * text_scale)}px;
+            height: {int(60 * text_scale)}px;
+        }}
+        QPushButton#action {{
+            background-color: #f0f0f0;
+            border: 1px solid #ccc;
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-size: {font_px}px;
+            color: black;
+            min-width: {int(100 * ui_scale)}px;
+            min-height: {int(50 * ui_scale)}px;
+        }}
+        QPushButton#action:hover {{
+            background-color: #e0e0e0;
+        }}
+        QPushButton#action:pressed {{
+            background-color: #d0d0d0;
+        }}
+        QPushButton#action:disabled {{
+            background-color: #cccccc;
+            color: #888888;
+        }}
+    """
+
+
+def _keyboard_stylesheet(text_scale, ui_scale):
+    return f"""
+        QPushButton#key {{
+            background-color: #ffffff;
+            border: 1px solid #ddd;
+            border-radius: 6px;
+            padding: 8px;
+            font-size: {int(60 * text_scale)}px;
+            color: black;
+            min-width: {int(60 * ui_scale)}px;
+            min-height: {int(60 * ui_scale)}px;
+        }}
+        QPushButton#key:hover {{
+            background-color: #f5f5f5;
+        }}
+    """
+
+
+def _top_bar_stylesheet(text_scale, ui_scale):
+    font_px = int(60 * text_scale)
+    return f"""
+        QPushButton#settings {{
+            background-color: #f0f0f0;
+            border: 1px solid #ccc;
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-size: {font_px}px;
+            color: black;
+            min-width: {int(100 * ui_scale)}px;
+            min-height: {int(50 * ui_scale)}px;
+        }}
+        QPushButton#settings:hover {{
+            background-color: #e0e0e0;
+        }}
+        QPushButton#task_button {{
+            background-color: #ffffff;
+            border: 1px solid #ccc;
+            border-radius: 6px;
+            padding: 6px 22px;
+            font-size: {font_px}px;
+            color: black;
+            min-width: {int(50 * ui_scale)}px;
+            min-height: {int(40 * ui_scale)}px;
+        }}
+        QPushButton#task_button:checked {{
+            background-color: #007acc;
+            color: white;
+            border: 1px solid #005fa3;
+        }}
+    """
+
+
+ROLES = {
+    "task": _task_stylesheet,
+    "top_bar": _top_bar_stylesheet,
+    "keyboard": _keyboard_stylesheet,
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_stylesheet(role, text_scale, ui_scale):
+    """Таблица стилей контейнера роли role (ключ ROLES) для заданного масштаба."""
+    return ROLES[role](text_scale, ui_scale)
@@ -0,0 +1,83 @@
+"""Векторная проверка batch_grading совпадает с покоординатной: problems и grading.
+
+Ответы batch_grading повторяют выборки KeyRandom и генераторы заданий над массивами,
+поэтому любое расхождение после смены Python или генератора должно ронять эти тесты.
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+
+import batch_grading  # noqa: E402
+import grading  # noqa: E402
+import problems  # noqa: E402
+
+TASKS = tuple(batch_grading.BATCH_ANSWERS)
+EDGE_CASES = (
+    "", " ", "-", "+", ".", ",", "-,5", "5,", ",5", " 5 ", "--5", "+-5", "-+5", "- 5", "5 5",
+    "5,,0", "5.0.0", "1,2,3", "1/1", "-1/1", "1e3", "0x10", "5a", "a5", "\t-3\n", "\x1c7\x1f",
+    "5\x005", "-0", "+0", "000", "1" * 18, "1" * 19, "9" * 40, "-" + "9" * 40, "0" * 30 + "7",
+    "1" * 70, " " * 70 + "5", "٣", "７", "5\xa0", "\x855", "−5", "５,0",
+)
+
+
+@pytest.fixture(scope="module")
+def keys():
+    rng = random.Random(2024)
+    return [problems.make_key(rng.choice(TASKS), rng.getrandbits(problems.SEED_BITS)) for _ in range(20000)]
+
+
+def test_versions_match_generators():
+    for task_id, (version, _) in batch_grading.BATCH_ANSWERS.items():
+        assert version == problems.GENERATOR_VERSIONS[task_id]
+
+
+def test_answer_array_matches_problem_from_key(keys):
+    answers = batch_grading.answer_array(np.array(keys, dtype=np.uint64))
+    expected = [problems.problem_from_key(key).exact_answer() for key in keys]
+    assert answers.tolist() == expected
+
+
+def test_grade_arrays_matches_grading(keys):
+    rng = random.Random(7)
+    items = [problems.problem_from_key(key) for key in keys]
+    answers = []
+    for p in items:
+        correct = p.answer_text()
+        kind = rng.random()
+        if kind < 0.3:
+            answers.append(correct)
+        elif kind < 0.4:
+            answers.append(rng.choice((f"{correct},0", f" {correct}.00 ", f"+{correct}", f"0{correct}")))
+        elif kind < 0.6:
+            answers.append(str(rng.randint(-200, 200)))
+        else:
+            edge = rng.choice(EDGE_CASES)
+            answers.append(rng.choice((edge, correct + edge, edge + correct)))
+
+    correct, invalid, accuracy = batch_grading.grade_arrays(keys, answers)
+    verdicts = [grading.grade(p, text) for p, text in zip(items, answers)]
+    assert correct.tolist() == [v == grading.CORRECT for v in verdicts]
+    assert invalid.tolist() == [v == grading.INVALID for v in verdicts]
+    for task_id, share in accuracy.items():
+        graded = [v for p, v in zip(items, verdicts) if p.task_id == task_id]
+        assert share == pytest.approx(graded.count(grading.CORRECT) / len(graded))
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_edge_cases_each_task(text):
+    for task_id in TASKS:
+        key = problems.make_key(task_id, 12345)
+        correct, invalid, _ = batch_grading.grade_arrays([key], [text])
+        verdict = grading.grade(problems.problem_from_key(key), text)
+        assert (bool(correct[0]), bool(invalid[0])) == (verdict == grading.CORRECT, verdict == grading.INVALID), text
+
+
+def test_unsupported_key_is_rejected():
+    with pytest.raises(ValueError):
+        batch_grading.answer_array([problems.make_key(2, 1)])
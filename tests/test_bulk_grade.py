@@ -0,0 +1,42 @@
+"""Проверка собранных ответов: испорченная строка становится ошибкой только этой строки."""
+import csv
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bulk_grade  # noqa: E402
+import grading  # noqa: E402
+import problems  # noqa: E402
+
+BAD_ROWS = (
+    {"task": "5", "a": "1.5", "b": "1", "c": "2.5", "d": "3"},  # Десятичное a
+    {"task": "5", "a": "3", "b": "1", "c": "3/8", "d": "3"},  # Обыкновенная дробь вместо десятичной
+    {"task": "6", "a": "1.5", "b": "2", "c": "5"},
+    {"task": "5", "a": "2", "b": "2", "c": "2.5", "d": "3"},  # Деление на ноль
+)
+
+
+def _csv(rows):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, ("task", "a", "b", "c", "d", "student_answer"), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    out.seek(0)
+    return out
+
+
+def test_malformed_params_in_the_middle_of_a_file():
+    good = problems.Task5Problem(3, 1, 2.5, 3.5)
+    good_row = {**{name: str(value) for name, value in good.params().items()},
+                "task": "5", "student_answer": good.answer_text()}
+    rows = [good_row] + [{**row, "student_answer": "1"} for row in BAD_ROWS] + [good_row]
+    out = io.StringIO()
+    summary, count = bulk_grade.run(_csv(rows), out, "csv", "jsonl")
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == len(rows)
+    assert [r["verdict"] for r in results] == [grading.CORRECT] + [bulk_grade.ERROR] * len(BAD_ROWS) + [grading.CORRECT]
+    assert all(r["error"] for r in results[1:-1])
+    assert summary.as_dict()["5"]["total"] == len(rows) - 1
@@ -0,0 +1,67 @@
+"""Журнал попыток: запись в фоновом потоке и восстановление оборванного хвоста."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import grading  # noqa: E402
+import journal  # noqa: E402
+
+
+def test_unencodable_input_does_not_stop_writer(tmp_path):
+    path = str(tmp_path / "attempts.journal")
+    log = journal.AttemptJournal(path, fsync_interval=0)
+    log.append(1, None, "\ud800-5", grading.WRONG, 1.0)  # Одиночный суррогат
+    log.append(1, None, "7", grading.WRONG, "не число")
+    log.append(1, None, "5", grading.CORRECT, 1.0)
+    log.close()
+    stats = log.stats()
+    assert stats["failed"] is None
+    assert (stats["written"], stats["skipped"]) == (2, 1)
+    assert [a.text for a in journal.read_journal(path)] == ["?-5", "5"]
+
+
+def _fill(path, texts):
+    log = journal.AttemptJournal(path, fsync_interval=0)
+    for text in texts:
+        log.append(1, None, text, grading.WRONG, 1.0)
+    log.close()
+    return log
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    path = str(tmp_path / "attempts.journal")
+    _fill(path, [str(i) for i in range(100)])
+    torn = journal.encode_attempt(1, None, "-12", grading.WRONG, 3.0, 0.0)
+    with open(path, "ab") as f:
+        f.write(torn[:len(torn) // 2])
+    log = _fill(path, ["5"])
+    assert log.recovered == len(torn) // 2
+    assert [a.text for a in journal.read_journal(path)] == [str(i) for i in range(100)] + ["5"]
+
+
+def test_garbage_longer_than_window_falls_back_to_full_scan(tmp_path):
+    path = str(tmp_path / "attempts.journal")
+    _fill(path, ["1", "2"])
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (journal.TAIL_WINDOW + 10))
+    log = _fill(path, ["3"])
+    assert log.recovered == journal.TAIL_WINDOW + 10
+    assert [a.text for a in journal.read_journal(path)] == ["1", "2", "3"]
+
+
+def test_old_format_is_moved_aside(tmp_path):
+    path = str(tmp_path / "attempts.journal")
+    with open(path, "wb") as f:
+        f.write(journal.HEADER.pack(journal.JOURNAL_MAGIC, 1) + b"old")
+    _fill(path, ["5"])
+    with open(path + ".old", "rb") as f:
+        assert f.read().endswith(b"old")
+    assert [a.text for a in journal.read_journal(path)] == ["5"]
+
+
+def test_unwritable_path_sets_failed(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    log = _fill(str(blocker / "attempts.journal"), ["5"])
+    assert isinstance(log.stats()["failed"], OSError)
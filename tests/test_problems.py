@@ -0,0 +1,51 @@
+"""Генерация условий и ключи условий."""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bulk  # noqa: E402
+import problems  # noqa: E402
+
+
+@pytest.fixture
+def no_task7_catalog(monkeypatch):
+    # Как после неудачной загрузки каталога: task7_catalog() возвращает None
+    monkeypatch.setattr(problems, "_TASK7_CATALOG", False)
+
+
+def test_task7_without_catalog_uses_rejection_loop(no_task7_catalog):
+    rng = random.Random(3)
+    for _ in range(50):
+        p = problems.generate(7, rng)
+        assert p.key is None
+        assert p.correct_answer.numerator == -1 and 2 <= p.correct_answer.denominator <= 9
+
+
+def test_task7_key_without_catalog_is_rejected(no_task7_catalog):
+    with pytest.raises(ValueError):
+        problems.problem_from_key(problems.make_key(7, 1))
+
+
+def test_bulk_task7_without_catalog(no_task7_catalog):
+    items = [problems.generate(7, random.Random(1))]
+    assert '"key": ""' in bulk.format_problems(items, "jsonl")
+    with pytest.raises(ValueError):
+        bulk.format_problems(items, "keys")
+
+
+@pytest.mark.parametrize("task_id, seed, version", [
+    (0, 1, None), (11, 1, None), (16, 1, 1), (-1, 1, 1), (1, 1, 16), (1, -1, None), (1, 1 << problems.SEED_BITS, None),
+])
+def test_make_key_rejects_out_of_range(task_id, seed, version):
+    with pytest.raises(ValueError):
+        problems.make_key(task_id, seed, version)
+
+
+@pytest.mark.parametrize("seed", ["-1", "x"])
+def test_bulk_rejects_bad_seed(seed):
+    with pytest.raises(SystemExit):
+        bulk.build_parser().parse_args(["--task", "1", "--seed", seed])
@@ -0,0 +1,90 @@
+"""Сколько условий генерируется при переключении заданий.
+
+Запуск из корня репозитория:
+    QT_QPA_PLATFORM=offscreen python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QSettings  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+import main  # noqa: E402
+import prefetch  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    """Номера заданий, для которых окно запросило условие."""
+    calls = []
+    get = prefetch.ProblemPrefetcher.get
+
+    def counting_get(self, task_id):
+        calls.append(task_id)
+        return get(self, task_id)
+
+    monkeypatch.setattr(prefetch.ProblemPrefetcher, "get", counting_get)
+    return calls
+
+
+@pytest.fixture
+def window(app, tmp_path, generated):
+    # Свои настройки без журнала попыток, чтобы не трогать настройки пользователя
+    for fmt in (QSettings.NativeFormat, QSettings.IniFormat):
+        QSettings.setPath(fmt, QSettings.UserScope, str(tmp_path))
+    QSettings("MathTrainer", "Settings").setValue("journal_path", "")
+    window = main.MathTrainer()
+    yield window
+    window.close()
+
+
+def test_first_switch_generates_one_problem(window, generated):
+    assert generated == [1]
+    for index in main.TASK_FACTORIES:
+        if index == 1:
+            continue
+        del generated[:]
+        window.select_task(index)
+        assert generated == [index]
+
+
+def test_revisit_resets_unsolved_problem(window, generated):
+    task = window.current_task_widget
+    task.input_field.setText("12")
+    window.select_task(2)
+    # Скрытое задание сброшено сразу, но новое условие ещё не сгенерировано
+    assert task.input_field.text() == ""
+    del generated[:]
+    window.select_task(1)
+    assert generated == [1]
+
+
+def test_revisit_after_answer_generates_new_problem(window, generated):
+    task = window.current_task_widget
+    task.input_field.setText(task.problem.answer_text())
+    task.check_answer()
+    window.select_task(2)
+    del generated[:]
+    window.select_task(1)
+    assert generated == [1]
+
+
+@pytest.fixture
+def no_task7_catalog(monkeypatch):
+    # До создания окна, чтобы и заранее подготовленные условия шли без каталога
+    monkeypatch.setattr(main.problems, "_TASK7_CATALOG", False)
+
+
+def test_task7_without_catalog(no_task7_catalog, window):
+    window.select_task(7)
+    assert window.current_task_widget.problem.key is None
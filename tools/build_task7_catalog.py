@@ -0,0 +1,78 @@
+"""Офлайн-сборка каталога условий задания 7.
+
+Перебирает все сочетания дробей б, в, г, д и числа е, при которых
+(1 + б)(в + г) - д / е = -1/N, 2 <= N <= 9, и сохраняет их в data/task7_catalog.bin
+(его читает problems.load_task7_catalog).
+
+Формат файла (версия 1): заголовок struct "<4sH" (b"T7CT", версия), далее
+zlib-сжатые данные:
+    u8 nb, nb пар (u8 числитель, u8 знаменатель) — значения б;
+    u8 nv, nv пар (u8 числитель, u8 знаменатель) — значения в и г;
+    для N = 2..9: u32 количество, u32 первый код, затем разности соседних кодов (u16).
+Код условия: ((ib * nv + iv) * nv + ig) * 8 + (е - 2); д восстанавливается из N.
+
+Запуск из корня репозитория:
+    python tools/build_task7_catalog.py
+"""
+import os
+import struct
+import sys
+import zlib
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from problems import TASK7_CATALOG_MAGIC, TASK7_CATALOG_PATH, TASK7_CATALOG_VERSION  # noqa: E402
+
+
+def domains():
+    # Те же диапазоны, что и в Task7.generate_task
+    values_b = sorted({Fraction(n, d) for d in range(3, 9) for n in range(1, d)})
+    values_v = sorted({Fraction(n, d) for d in range(4, 13) for n in range(1, d + 3) if n % d != 0})
+    values_d = {Fraction(n, d) for d in range(3, 8) for n in range(3 * d, 13 * d + 1) if n % d != 0}
+    return values_b, values_v, values_d
+
+
+def build():
+    values_b, values_v, values_d = domains()
+    nv = len(values_v)
+    groups = {n: [] for n in range(2, 10)}
+    for ib, frac_b in enumerate(values_b):
+        for iv, frac_v in enumerate(values_v):
+            for ig, frac_g in enumerate(values_v):
+                if frac_g == frac_v:
+                    continue
+                product = (1 + frac_b) * (frac_v + frac_g)
+                for e in range(2, 10):
+                    for n in range(2, 10):
+                        # д / е = (1 + б)(в + г) + 1/N
+                        if e * (product + Fraction(1, n)) in values_d:
+                            groups[n].append(((ib * nv + iv) * nv + ig) * 8 + (e - 2))
+    return values_b, values_v, groups
+
+
+def encode(values_b, values_v, groups):
+    payload = bytearray()
+    for values in (values_b, values_v):
+        payload += struct.pack("<B", len(values))
+        for value in values:
+            payload += struct.pack("<BB", value.numerator, value.denominator)
+    for n in range(2, 10):
+        codes = groups[n]
+        payload += struct.pack("<II", len(codes), codes[0])
+        for previous, code in zip(codes, codes[1:]):
+            payload += struct.pack("<H", code - previous)
+    return struct.pack("<4sH", TASK7_CATALOG_MAGIC, TASK7_CATALOG_VERSION) + zlib.compress(bytes(payload), 9)
+
+
+def main():
+    values_b, values_v, groups = build()
+    data = encode(values_b, values_v, groups)
+    with open(TASK7_CATALOG_PATH, "wb") as f:
+        f.write(data)
+    total = sum(len(codes) for codes in groups.values())
+    print(f"{total} условий, {len(data)} байт -> {TASK7_CATALOG_PATH}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()